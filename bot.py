@@ -4,16 +4,30 @@ Beet Telegram Bot - Interactive music import manager
 Main entry point
 """
 from telegram import MenuButtonCommands, BotCommand
+from telegram.request import HTTPXRequest
 from telegram.ext import (
+    AIORateLimiter,
     Application,
     CommandHandler,
     CallbackQueryHandler,
     MessageHandler,
     filters,
 )
-from config import TELEGRAM_TOKEN, CUSTOM_COMMANDS, setup_logging
+from config import (
+    TELEGRAM_TOKEN,
+    CUSTOM_COMMANDS,
+    WEBHOOK_URL,
+    WEBHOOK_LISTEN,
+    WEBHOOK_PORT,
+    WEBHOOK_SECRET,
+    TG_POOL_SIZE,
+    TG_POOL_TIMEOUT,
+    DROP_PENDING_UPDATES,
+    setup_logging,
+)
 from core.beet_manager import BeetImportManager
 from core.plugin_detector import get_plugin_detector
+from core.telegram_batcher import TelegramBatcher
 from handlers.commands import start, list_imports, status, cancel_import, execute_custom_command
 from handlers.callbacks import button_callback
 from handlers.messages import handle_message
@@ -40,32 +54,48 @@ def main():
     sources = detector.get_metadata_sources()
     logger.info(f"📚 Available metadata sources: {', '.join(sources)}")
 
-    app = Application.builder().token(TELEGRAM_TOKEN).build()
-
-    # Wrapper functions to pass the manager instance
-    async def start_wrapper(update, context):
-        await start(update, context, manager)
-
-    async def list_wrapper(update, context):
-        await list_imports(update, context, manager)
-
-    async def status_wrapper(update, context):
-        await status(update, context, manager)
-
-    async def cancel_wrapper(update, context):
-        await cancel_import(update, context, manager)
-
-    async def callback_wrapper(update, context):
-        await button_callback(update, context, manager)
-
-    async def message_wrapper(update, context):
-        await handle_message(update, context, manager)
+    # 🌐 HTTP/2 multiplexes concurrent API calls over one connection
+    builder = (
+        Application.builder()
+        .token(TELEGRAM_TOKEN)
+        .concurrent_updates(True)
+        .request(HTTPXRequest(
+            http_version="2",
+            connection_pool_size=TG_POOL_SIZE,
+            pool_timeout=TG_POOL_TIMEOUT,
+            connect_timeout=10,
+            read_timeout=30,
+            write_timeout=30,
+        ))
+        .get_updates_request(HTTPXRequest(
+            http_version="2",
+            connection_pool_size=16,
+            pool_timeout=TG_POOL_TIMEOUT,
+            connect_timeout=10,
+            read_timeout=30,
+            write_timeout=30,
+        ))
+    )
+
+    # 🚦 Space outgoing calls to stay under Telegram flood limits
+    try:
+        builder = builder.rate_limiter(
+            AIORateLimiter(overall_max_rate=30, overall_time_period=1, max_retries=3)
+        )
+    except RuntimeError as e:
+        # aiolimiter not installed (python-telegram-bot[rate-limiter])
+        logger.warning(f"⚠️ Rate limiter unavailable, sending without it: {e}")
+
+    app = builder.build()
+
+    # Share the manager instance with all handlers
+    app.bot_data["manager"] = manager
 
     # Register core handlers
-    app.add_handler(CommandHandler("start", start_wrapper))
-    app.add_handler(CommandHandler("list", list_wrapper))
-    app.add_handler(CommandHandler("status", status_wrapper))
-    app.add_handler(CommandHandler("cancel", cancel_wrapper))
+    app.add_handler(CommandHandler("start", start))
+    app.add_handler(CommandHandler("list", list_imports))
+    app.add_handler(CommandHandler("status", status))
+    app.add_handler(CommandHandler("cancel", cancel_import))
 
     # 🔧 Register custom commands dynamically
     for item in CUSTOM_COMMANDS:
@@ -73,11 +103,18 @@ def main():
         app.add_handler(CommandHandler(cmd_name, execute_custom_command))
         logger.info(f"Registered custom command: /{cmd_name} -> {item['action']}")
 
-    app.add_handler(CallbackQueryHandler(callback_wrapper))
-    app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, message_wrapper))
+    app.add_handler(CallbackQueryHandler(button_callback))
+    app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
 
     # ⚙️ Setup bot menu and commands list after init
     async def post_init(application):
+        # 🧹 Remove any stale webhook so getUpdates is allowed (polling only)
+        if not WEBHOOK_URL:
+            try:
+                await application.bot.delete_webhook(drop_pending_updates=DROP_PENDING_UPDATES)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not delete webhook: {e}")
+
         try:
             # Define core commands
             core_commands = [
@@ -102,10 +139,37 @@ def main():
         except Exception as e:
             logger.warning(f"⚠️ Error during menu button configuration: {e}")
 
-    app.post_init = post_init
+        # 📦 Coalesce streamed beet output into few messages
+        batcher = TelegramBatcher(application.bot)
+        batcher.start()
+        application.bot_data["batcher"] = batcher
 
-    logger.info("🤖 Bot started!")
-    app.run_polling()
+        # 💾 Coalesce state saves into at most one write every 0.25s
+        manager.start_state_flusher()
+
+    async def post_shutdown(application):
+        batcher = application.bot_data.pop("batcher", None)
+        if batcher:
+            await batcher.stop()
+        await manager.stop_state_flusher()
+        await manager.stop_daemon()
+
+    app.post_init = post_init
+    app.post_shutdown = post_shutdown
+
+    if WEBHOOK_URL:
+        logger.info(f"🤖 Bot started with webhook on {WEBHOOK_LISTEN}:{WEBHOOK_PORT}")
+        app.run_webhook(
+            listen=WEBHOOK_LISTEN,
+            port=WEBHOOK_PORT,
+            url_path=TELEGRAM_TOKEN,
+            webhook_url=f"{WEBHOOK_URL}/{TELEGRAM_TOKEN}",
+            secret_token=WEBHOOK_SECRET,
+            drop_pending_updates=DROP_PENDING_UPDATES,
+        )
+    else:
+        logger.info("🤖 Bot started!")
+        app.run_polling(drop_pending_updates=DROP_PENDING_UPDATES)
 
 
 if __name__ == "__main__":
@@ -4,22 +4,40 @@ Centralized configuration for the Beet Telegram Bot
 import os
 import json
 import logging
+from pathlib import Path
 
 # Telegram Configuration
 TELEGRAM_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN')
 TELEGRAM_CHAT_ID = os.environ.get('TELEGRAM_CHAT_ID')
 
+# Webhook Configuration (leave WEBHOOK_URL empty to use long polling)
+WEBHOOK_URL = os.environ.get('WEBHOOK_URL', '').rstrip('/')
+WEBHOOK_LISTEN = os.environ.get('WEBHOOK_LISTEN', '0.0.0.0')
+WEBHOOK_PORT = int(os.environ.get('WEBHOOK_PORT', '8443'))
+WEBHOOK_SECRET = os.environ.get('WEBHOOK_SECRET') or None
+
+# Telegram HTTP client tuning
+TG_POOL_SIZE = int(os.environ.get('TG_POOL_SIZE', '256'))
+TG_POOL_TIMEOUT = float(os.environ.get('TG_POOL_TIMEOUT', '30'))
+
+# Skip updates received while the bot was offline
+DROP_PENDING_UPDATES = os.environ.get('DROP_PENDING_UPDATES', 'true').lower() == 'true'
+
 # Beet Configuration
 BEET_CONTAINER = os.environ.get('BEET_CONTAINER')
 BEET_USER = os.environ.get('BEET_USER')
+# Keep one relay process in the container instead of a docker exec per command
+BEET_DAEMON = os.environ.get('BEET_DAEMON', 'true').lower() == 'true'
 BEET_LIBRARY = os.environ.get('BEET_LIBRARY', '/music')
 IMPORT_PATH = os.environ.get('IMPORT_PATH', '/downloads')
+IMPORT_PATH_P = Path(IMPORT_PATH).resolve()
 BEET_DEBUG_MODE = os.environ.get('BEET_DEBUG_MODE', 'false').lower() == 'true'
 BEET_PRETEND = os.environ.get('BEET_PRETEND','false').lower() == 'true'
 
 # Custom beet container commands
 CUSTOM_COMMANDS_JSON = os.environ.get('CUSTOM_COMMANDS', '[]')
-CUSTOM_COMMANDS = json.loads(CUSTOM_COMMANDS_JSON)
+CUSTOM_COMMANDS = tuple(json.loads(CUSTOM_COMMANDS_JSON))
+CUSTOM_COMMANDS_BY_NAME = {item['cmd']: item for item in CUSTOM_COMMANDS}
 
 # Internationalization Configuration
 LANGUAGE = os.environ.get('LANGUAGE', 'en')
@@ -27,9 +45,12 @@ LANGUAGE = os.environ.get('LANGUAGE', 'en')
 # State file
 STATE_FILE = '/tmp/beet_import_state.json'
 
+# Detected beet plugins, reused across restarts while beet is unchanged
+PLUGIN_CACHE_FILE = '/tmp/beet_plugins.json'
+
 # Supported file extensions
-AUDIO_EXTENSIONS = {'.flac', '.mp3', '.m4a', '.ogg', '.opus', '.wav', '.wv', '.ape'}
-IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
+AUDIO_EXTENSIONS = frozenset({'.flac', '.mp3', '.m4a', '.ogg', '.opus', '.wav', '.wv', '.ape'})
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'})
 
 # Diff style for displaying differences
 # Options: 'char', 'word', 'smart', 'simple'
@@ -39,7 +60,11 @@ DIFF_STYLE = os.environ.get('DIFF_STYLE', 'smart')
 LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 
 def setup_logging():
-    """Configures logging for the application"""
+    """Configures logging for the application (only the first call does work)"""
+    if getattr(setup_logging, "_done", False):
+        return logging.getLogger(__name__)
+    setup_logging._done = True
+
     logging.basicConfig(
         level=getattr(logging, LOG_LEVEL),
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -0,0 +1,105 @@
+"""
+Command relay that runs INSIDE the beets container.
+
+BeetImportManager starts it once with `docker exec -i <container> python3 -c <source>`
+and then sends one JSON request per line on stdin:
+    {"id": 1, "argv": ["beet", "ls", ...], "stdin": "...", "timeout": 300}
+Each request runs in its own thread and is answered with one JSON line on
+stdout, tagged with the same id (replies may arrive out of order):
+    {"id": 1, "rc": 0, "stdout": "...", "stderr": "..."}
+    {"kill": 1} kills request 1's process group (no reply of its own).
+
+beet itself still runs as a fresh process per request (beets keeps global
+config/plugin state, so re-entering beets.ui.main in one process is unsafe);
+what is saved is the docker exec/attach round-trip for every call.
+Standard library only: the container has no bot dependencies.
+"""
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+
+_write_lock = threading.Lock()
+_running = {}  # request id -> Popen
+_running_lock = threading.Lock()
+
+
+def _kill(proc):
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+def handle(request):
+    req_id = request.get("id")
+    timeout = request.get("timeout") or None
+    try:
+        proc = subprocess.Popen(
+            request["argv"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            start_new_session=True,
+        )
+    except Exception as e:
+        return {"id": req_id, "rc": -1, "stdout": "", "stderr": str(e)}
+
+    with _running_lock:
+        _running[req_id] = proc
+    try:
+        # No stdin -> empty input, so beet sees EOF instead of reading the request pipe
+        stdout, stderr = proc.communicate(request.get("stdin") or "", timeout=timeout)
+        return {"id": req_id, "rc": proc.returncode, "stdout": stdout, "stderr": stderr}
+    except subprocess.TimeoutExpired:
+        _kill(proc)
+        proc.communicate()
+        return {"id": req_id, "rc": -1, "stdout": "", "stderr": f"Command timed out after {timeout}s"}
+    except Exception as e:
+        _kill(proc)
+        return {"id": req_id, "rc": -1, "stdout": "", "stderr": str(e)}
+    finally:
+        with _running_lock:
+            _running.pop(req_id, None)
+
+
+def reply(response):
+    data = json.dumps(response) + "\n"
+    with _write_lock:
+        sys.stdout.write(data)
+        sys.stdout.flush()
+
+
+def serve(request):
+    reply(handle(request))
+
+
+def main():
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            reply({"id": None, "rc": -1, "stdout": "", "stderr": f"Bad request: {e}"})
+            continue
+        if "kill" in request:
+            with _running_lock:
+                proc = _running.get(request["kill"])
+            if proc:
+                _kill(proc)
+            continue
+        threading.Thread(target=serve, args=(request,), daemon=True).start()
+
+    # Bot side went away: take the running commands down with us
+    with _running_lock:
+        for proc in _running.values():
+            _kill(proc)
+
+
+if __name__ == "__main__":
+    main()
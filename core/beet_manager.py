@@ -3,31 +3,178 @@ BeetImportManager (refactored)
 Uses parsers.parse_beet_output to produce a canonical import structure.
 """
 import os
-import json
+import atexit
+import errno
+import logging
+import asyncio
+import signal
 import subprocess
+import time
 import shutil
+import mmap
+import itertools
+from collections import deque, namedtuple, OrderedDict
 from pathlib import Path
-from config import IMPORT_PATH, STATE_FILE, BEET_CONTAINER, BEET_USER, BEET_PRETEND, setup_logging
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+    import json
+from config import IMPORT_PATH, IMPORT_PATH_P, STATE_FILE, BEET_CONTAINER, BEET_USER, BEET_PRETEND, BEET_DAEMON
 from core.parsers import parse_beet_output  # updated parser
 from core.parsers import clean_ansi_codes
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
+
+def _json_dumps(obj, indent=False):
+    """Serialize to UTF-8 bytes (orjson when available)"""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data):
+    """Parse JSON from bytes/str/memoryview (orjson when available)"""
+    if orjson:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+# Lines kept per stream while beet runs: the first and the last
+# MAX_OUTPUT_LINES each (the -vv "Candidate:"/ID lines come early)
+MAX_OUTPUT_LINES = 10000
+
+# Max folders remembered by search_candidates (least recently used dropped)
+SEARCH_CACHE_SIZE = 256
+# Seconds a remembered search stays valid: results depend on the beets
+# library, which can change outside the bot (custom commands, other clients)
+SEARCH_CACHE_TTL = 300
+
+# Resolved import root, and the same with a trailing separator for containment checks
+_IMPORT_ROOT_DIR = os.path.realpath(IMPORT_PATH_P)
+_IMPORT_ROOT = os.path.join(_IMPORT_ROOT_DIR, "")
+
+# External rm used for fast recursive deletes (None -> shutil.rmtree)
+_RM_BIN = shutil.which("rm")
+
+# Source of the in-container relay, sent with `python3 -c` (see core/beet_daemon.py)
+_DAEMON_SOURCE = (Path(__file__).parent / "beet_daemon.py").read_text()
+
+# Result returned when beet could not run or timed out
+_FakeResult = namedtuple("_FakeResult", "returncode stdout stderr args")
+
+
+class _OutputBuffer:
+    """Line buffer keeping the head and tail of a stream, bounded in both"""
+
+    def __init__(self, keep=MAX_OUTPUT_LINES):
+        self.head = []
+        self.tail = deque(maxlen=keep)
+        self.keep = keep
+        self.dropped = 0
+
+    def append(self, line):
+        if len(self.head) < self.keep:
+            self.head.append(line)
+            return
+        if len(self.tail) == self.keep:
+            self.dropped += 1
+        self.tail.append(line)
+
+    def text(self):
+        middle = [f"... {self.dropped} lines omitted ..."] if self.dropped else []
+        return "\n".join(self.head + middle + list(self.tail))
+
+
+def _dir_signature(path):
+    """(file_count, total_size, max_mtime_ns) of everything below path, one scandir walk"""
+    count = total = newest = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    count += 1
+                    total += st.st_size
+                    if st.st_mtime_ns > newest:
+                        newest = st.st_mtime_ns
+        except OSError:
+            continue
+    return (count, total, newest)
+
+
+def _move_unique(src, dest_dir):
+    """
+    Rename src into dest_dir, adding _1, _2... on name clashes.
+    skipped/ lives under the import root, so this is a plain rename(2).
+    rename(2) silently replaces an existing file or empty folder, so taken
+    names are skipped with lexists() first; the rename errors still cover
+    a non-empty folder appearing in between.
+    """
+    # Created on every call: the folder may have been removed while the bot runs
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    dst = dest_dir / src.name
+    counter = 1
+    while True:
+        if not os.path.lexists(dst):
+            try:
+                os.rename(src, dst)
+                return dst
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    # Different filesystem after all (bind mount): copy + delete
+                    if os.path.lexists(dst):
+                        raise
+                    shutil.move(str(src), str(dst))
+                    return dst
+                if e.errno not in (errno.EEXIST, errno.ENOTEMPTY, errno.ENOTDIR, errno.EISDIR):
+                    raise
+        dst = dest_dir / f"{src.name}_{counter}"
+        counter += 1
 
 
 class BeetImportManager:
+    _SKIPPED = IMPORT_PATH_P / "skipped"
+
     def __init__(self):
         self.current_import = None
+        self._dir_cache = None  # (parent_mtime_ns, sorted_dirs)
+        self._dirty = False
+        self._flush_task = None
+        self._daemon = None
+        self._daemon_lock = asyncio.Lock()  # held only to start the relay / write a request
+        self._daemon_reader = None
+        self._daemon_pending = {}  # request id -> Future for its reply
+        self._daemon_ids = itertools.count(1)
+        # Updates run concurrently: one import at a time touches current_import/state
+        self.import_lock = asyncio.Lock()
+        self._lib = None  # beets Library, False when unavailable
+        self._cmd_prefix, self._cmd_prefix_interactive = self._build_prefixes()
+        # Last-chance write if the process exits between flushes
+        atexit.register(self._flush_if_dirty)
+        self._search_cache = OrderedDict()  # (path, *signature) -> (monotonic time, search result)
         self.load_state()
 
     # ======================================================
     # STATE MANAGEMENT
     # ======================================================
     def load_state(self):
-        """Load current import state from JSON file"""
+        """Load current import state from JSON file (mmap'd, no extra buffer copy)"""
         try:
             if Path(STATE_FILE).exists():
-                with open(STATE_FILE, "r", encoding="utf-8") as f:
-                    self.current_import = json.load(f)
+                with open(STATE_FILE, "rb") as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        self.current_import = None
+                        return
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        self.current_import = _json_loads(memoryview(mm))
             else:
                 self.current_import = None
         except Exception as e:
@@ -35,45 +182,98 @@ class BeetImportManager:
             self.current_import = None
 
     def save_state(self):
-        """Persist current import state"""
+        """
+        Persist current import state.
+        While the flush task is running, rapid saves are coalesced into one write.
+        """
+        if self._flush_task:
+            self._dirty = True
+        else:
+            self._write_state()
+
+    def _write_state(self):
+        """Atomically write current import state to STATE_FILE"""
+        self._dirty = False
+        tmp = STATE_FILE + ".tmp"
         try:
-            with open(STATE_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.current_import, f, ensure_ascii=False, indent=2)
+            with open(tmp, "wb") as f:
+                f.write(_json_dumps(self.current_import, indent=True))
+            os.replace(tmp, STATE_FILE)
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
 
     def clear_state(self):
         """Clear current import state and delete file"""
         self.current_import = None
+        self._dirty = False
         try:
             Path(STATE_FILE).unlink(missing_ok=True)
         except Exception as e:
             logger.warning(f"Could not clear state: {e}")
 
+    def _flush_if_dirty(self):
+        """Write state now if a coalesced save is pending"""
+        if self._dirty:
+            self._write_state()
+
+    def start_state_flusher(self, interval=0.25):
+        """Start the background task that writes dirty state (needs a running event loop)"""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop(interval))
+
+    async def stop_state_flusher(self):
+        """Stop the flush task and write any pending state"""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        self._flush_if_dirty()
+
+    async def _flush_loop(self, interval):
+        while True:
+            await asyncio.sleep(interval)
+            self._flush_if_dirty()
+
     # ======================================================
     # DIRECTORY OPERATIONS
     # ======================================================
     def get_import_directories(self):
-        """Return a sorted list of directories under the import folder"""
-        import_path = Path(IMPORT_PATH)
-        if not import_path.exists():
+        """
+        Return a sorted list of directories under the import folder.
+        The listing is cached and only rebuilt when the folder's mtime changes.
+        """
+        try:
+            parent_mtime = os.stat(IMPORT_PATH).st_mtime_ns
+        except OSError:
             return []
 
-        dirs = [
-            d for d in import_path.iterdir()
-            if d.is_dir() and d.name not in ["skipped", ".", ".."]
-        ]
-        dirs.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        if self._dir_cache and self._dir_cache[0] == parent_mtime:
+            return self._dir_cache[1]
+
+        # DirEntry caches is_dir()/stat() from the directory read
+        with os.scandir(IMPORT_PATH) as it:
+            entries = [e for e in it if e.is_dir() and e.name != "skipped"]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+
+        dirs = [Path(e.path) for e in entries]
+        self._dir_cache = (parent_mtime, dirs)
         return dirs
 
+    def invalidate_dirs_cache(self):
+        """Force the next get_import_directories() call to rescan"""
+        self._dir_cache = None
+
     def _validate_path(self, path):
-        """Ensure the path is inside the import root"""
-        dir_path = Path(path)
-        if not dir_path.exists():
+        """Ensure the path is inside the import root (symlinks and '..' resolved)"""
+        real_path = os.path.realpath(path)
+        if not os.path.exists(real_path):
             return "error_not_found"
-        if str(dir_path) == str(IMPORT_PATH):
+        if real_path == _IMPORT_ROOT_DIR:
             return "error_root"
-        if not str(dir_path).startswith(str(IMPORT_PATH)):
+        if not real_path.startswith(_IMPORT_ROOT):
             return "error_not_found"
         return None
 
@@ -84,33 +284,178 @@ class BeetImportManager:
     # ======================================================
     # SUBPROCESS HELPERS
     # ======================================================
+    @staticmethod
+    def _build_prefixes():
+        """Docker exec prefixes (plain, interactive); both None without a container"""
+        if not BEET_CONTAINER:
+            return None, None
+        user = ["-u", BEET_USER] if BEET_USER else []
+        return (
+            ["docker", "exec"] + user + [BEET_CONTAINER],
+            ["docker", "exec", "-i"] + user + [BEET_CONTAINER],
+        )
+
     def _build_command(self, beet_args, interactive=False):
         """Build the full command array for beet, supporting Docker"""
-        if BEET_CONTAINER:
-            cmd = ["docker", "exec"]
-            if interactive:
-                cmd.append("-i")
-            if BEET_USER:
-                cmd.extend(["-u", BEET_USER])
-            cmd.extend([BEET_CONTAINER] + beet_args)
-        else:
-            cmd = beet_args
-        return cmd
+        if self._cmd_prefix is None:
+            return beet_args
+        return (self._cmd_prefix_interactive if interactive else self._cmd_prefix) + beet_args
+
+    async def _read_stream(self, stream, buffer, on_line=None):
+        """Read a subprocess pipe line by line into an _OutputBuffer (ANSI codes stripped)"""
+        async for raw in stream:
+            line = clean_ansi_codes(raw.decode(errors="replace").rstrip("\n"))
+            buffer.append(line)
+            if on_line:
+                try:
+                    on_line(line)
+                except Exception as e:
+                    logger.debug(f"on_line callback failed: {e}")
+
+    # ======================================================
+    # IN-CONTAINER RELAY
+    # ======================================================
+    async def _start_daemon(self):
+        """Start the relay inside the beets container and its reply reader"""
+        cmd = self._cmd_prefix_interactive + ["python3", "-c", _DAEMON_SOURCE]
+        self._daemon = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=64 * 1024 * 1024,
+        )
+        self._daemon_reader = asyncio.create_task(self._read_daemon(self._daemon))
+        logger.info(f"Started beet relay in container {BEET_CONTAINER}")
+
+    async def _read_daemon(self, daemon):
+        """Route relay replies to the waiting requests by id"""
+        try:
+            async for line in daemon.stdout:
+                response = _json_loads(line)
+                future = self._daemon_pending.pop(response.get("id"), None)
+                # No waiter: the request timed out on our side, drop the late reply
+                if future and not future.done():
+                    future.set_result(response)
+            error = ConnectionResetError("relay closed its output")
+        except Exception as e:
+            error = e
+        if self._daemon is daemon:
+            self._daemon = None
+        self._fail_daemon_pending(error)
+
+    def _fail_daemon_pending(self, error):
+        pending, self._daemon_pending = self._daemon_pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def stop_daemon(self):
+        """Terminate the relay process, if any"""
+        daemon, self._daemon = self._daemon, None
+        reader, self._daemon_reader = self._daemon_reader, None
+        if reader:
+            reader.cancel()
+        self._fail_daemon_pending(ConnectionResetError("relay stopped"))
+        if daemon and daemon.returncode is None:
+            daemon.kill()
+            await daemon.wait()
+
+    async def _send_daemon(self, message):
+        async with self._daemon_lock:
+            if self._daemon is None or self._daemon.returncode is not None:
+                await self._start_daemon()
+            self._daemon.stdin.write(_json_dumps(message) + b"\n")
+            await self._daemon.stdin.drain()
+
+    async def _run_via_daemon(self, beet_args, input_data, timeout):
+        """
+        Run a beet command through the relay.
+        Requests are tagged with an id, so several commands can be in flight at once.
+        Returns None when the relay is unusable so the caller can fall back to docker exec.
+        """
+        req_id = next(self._daemon_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._daemon_pending[req_id] = future
+        try:
+            await self._send_daemon({"id": req_id, "argv": beet_args, "stdin": input_data, "timeout": timeout})
+            # The relay enforces the timeout itself; allow a little slack
+            response = await asyncio.wait_for(future, timeout=timeout + 10)
+        except asyncio.TimeoutError:
+            logger.error(f"Timeout executing via relay: {' '.join(beet_args)}")
+            # Have the relay kill the command; a late reply is dropped by id
+            try:
+                await self._send_daemon({"kill": req_id})
+            except Exception:
+                await self.stop_daemon()
+            return _FakeResult(-1, '', f'Command timed out after {timeout}s', beet_args)
+        except Exception as e:
+            logger.warning(f"Beet relay failed, falling back to docker exec: {e}")
+            await self.stop_daemon()
+            return None
+        finally:
+            self._daemon_pending.pop(req_id, None)
+
+        result = subprocess.CompletedProcess(
+            beet_args,
+            response["rc"],
+            clean_ansi_codes(response["stdout"]),
+            clean_ansi_codes(response["stderr"]),
+        )
+        self._log_result(beet_args, result)
+        return result
+
+    async def _run_command(self, beet_args, input_data=None, timeout=300, interactive=False, on_line=None):
+        """
+        Execute beet command without blocking the event loop and return subprocess result.
+        Output is streamed line by line; on_line(line) is called for every line as it arrives.
+        """
+        # Relay returns whole output at the end, so streaming calls keep using docker exec
+        if BEET_CONTAINER and BEET_DAEMON and on_line is None:
+            result = await self._run_via_daemon(beet_args, input_data, timeout)
+            if result is not None:
+                return result
 
-    def _run_command(self, beet_args, input_data=None, timeout=300, interactive=False):
-        """Execute beet command and return subprocess result"""
         cmd = self._build_command(beet_args, interactive)
+        proc = None
         try:
-            result = subprocess.run(
-                cmd,
-                input=input_data,
-                capture_output=True,
-                text=True,
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=1024 * 1024,
+                # Own process group, so a timeout can kill beet's children too
+                start_new_session=(os.name == "posix"),
+            )
+
+            if input_data:
+                try:
+                    proc.stdin.write(input_data.encode())
+                    await proc.stdin.drain()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+            proc.stdin.close()
+
+            stdout_lines = _OutputBuffer()
+            stderr_lines = _OutputBuffer()
+            await asyncio.wait_for(
+                asyncio.gather(
+                    self._read_stream(proc.stdout, stdout_lines, on_line),
+                    self._read_stream(proc.stderr, stderr_lines, on_line),
+                    proc.wait(),
+                ),
                 timeout=timeout,
             )
+            result = subprocess.CompletedProcess(
+                cmd,
+                proc.returncode,
+                stdout_lines.text(),
+                stderr_lines.text(),
+            )
             self._log_result(cmd, result)
             return result
-        except subprocess.TimeoutExpired as e:
+        except asyncio.TimeoutError:
             logger.error(f"Timeout executing: {' '.join(cmd)}")
 
             # If we are in a Docker container, kill the process
@@ -123,59 +468,160 @@ class BeetImportManager:
             #     except Exception as kill_err:
             #         logger.error(f"Failed to kill hanging beet process: {kill_err}")
 
-            return type('Result', (), {
-                'returncode': -1,
-                'stdout': '',
-                'stderr': f'Command timed out after {timeout}s',
-                'args': cmd
-            })()
+            return _FakeResult(-1, '', f'Command timed out after {timeout}s', cmd)
         except Exception as e:
+            # e.g. ValueError for a single line over the 1 MiB reader limit
             logger.error(f"Error executing beet: {e}", exc_info=True)
-            return type('Result', (), {
-                'returncode': -1,
-                'stdout': '',
-                'stderr': str(e),
-                'args': cmd
-            })()
+            return _FakeResult(-1, '', str(e), cmd)
+        finally:
+            # Never leave beet running/unreaped on timeout, error or cancellation
+            if proc and proc.returncode is None:
+                await self._kill_process(proc)
+
+    async def _kill_process(self, proc, grace=5):
+        """
+        Kill proc and its whole process group, then reap it.
+        Grandchildren holding the pipes would otherwise keep proc.wait() pending;
+        the final wait is bounded either way.
+        """
+        if proc.returncode is None:
+            try:
+                if os.name == "posix":
+                    os.killpg(proc.pid, signal.SIGKILL)
+                else:
+                    proc.kill()
+            except (ProcessLookupError, PermissionError):
+                pass
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=grace)
+        except asyncio.TimeoutError:
+            logger.warning(f"Process {proc.pid} not reaped after kill")
 
     def _log_result(self, cmd, result):
         """Log standardized subprocess output"""
-        logger.debug(f"[BEET CMD] {' '.join(cmd)}")
-        if not result:
-            return
-        logger.debug(f"[RETURN] {result.returncode}")
-        if result.stdout:
-            logger.debug(result.stdout[:2000])
-        if result.stderr:
+        # Skip the join/slices entirely when debug output is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[BEET CMD] {' '.join(cmd)}")
+            if result:
+                logger.debug(f"[RETURN] {result.returncode}")
+                if result.stdout:
+                    logger.debug(result.stdout[:2000])
+        if result and result.stderr:
             logger.warning(result.stderr[:2000])
 
+    # ======================================================
+    # SEARCH CACHE
+    # ======================================================
+    def clear_search_cache(self):
+        """Forget memoized searches (the beets library may have changed)"""
+        self._search_cache.clear()
+
+    # ======================================================
+    # NATIVE BEETS ACCESS (local installs only)
+    # ======================================================
+    def _get_lib(self):
+        """Open the beets library once (configured plugins loaded); None -> use the CLI"""
+        if self._lib is None:
+            try:
+                from beets import config as beets_config
+                from beets import library, plugins
+                # Plugins first, as `beet` does: they add fields/queries used by format_album
+                try:
+                    plugins.load_plugins()  # beets >= 2.3 reads config["plugins"] itself
+                except TypeError:
+                    plugins.load_plugins(beets_config["plugins"].as_str_seq())
+                    plugins.send("pluginload")
+                    for model in (library.Item, library.Album):
+                        model._types.update(plugins.types(model))
+                        model._queries.update(plugins.named_queries(model))
+                self._lib = library.Library(
+                    beets_config["library"].as_filename(),
+                    beets_config["directory"].as_filename(),
+                )
+                plugins.send("library_opened", lib=self._lib)
+            except Exception as e:
+                logger.info(f"beets Python API unavailable, using the CLI: {e}")
+                self._lib = False
+        return self._lib or None
+
+    def _ls_albums_native(self, query):
+        """
+        Equivalent of `beet ls -a <query>` through the beets library API.
+        Returns a CompletedProcess-like result, or None to fall back to the CLI.
+        """
+        lib = self._get_lib()
+        if lib is None:
+            return None
+        try:
+            # One pre-split part, like the single argv item `beet ls` gets: a plain
+            # string would be shlex-split on the spaces/quotes in folder names.
+            # format() applies the user's format_album template.
+            output = "\n".join(format(album) for album in lib.albums([query]))
+        except Exception as e:
+            logger.warning(f"Native beets query failed, using the CLI: {e}")
+            return None
+        return subprocess.CompletedProcess(["beet", "ls", "-a", query], 0, output, "")
+
     # ======================================================
     # SEARCH & IMPORT OPERATIONS
     # ======================================================
-    def search_candidates(self, path):
-        """Search for candidate matches without importing"""
+    async def search_candidates(self, path):
+        """
+        Search for candidate matches without importing.
+        Results are memoized in memory per folder content signature for
+        SEARCH_CACHE_TTL seconds, so reopening an unchanged folder does not run beet again.
+        """
+        key = (str(path),) + await asyncio.to_thread(_dir_signature, path)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            stamp, response = cached
+            if time.monotonic() - stamp < SEARCH_CACHE_TTL:
+                self._search_cache.move_to_end(key)
+                return dict(response)
+            del self._search_cache[key]
+
         beet_path = self.translate_path_for_beet(path)
-        result = self._run_command(["beet", "ls", "-a", f"path:{beet_path}"], timeout=300)
+        query = f"path:{beet_path}"
+        result = None
+        if not BEET_CONTAINER:
+            result = await asyncio.to_thread(self._ls_albums_native, query)
+        if result is None:
+            result = await self._run_command(["beet", "ls", "-a", query], timeout=300)
         if not result:
             return {"status": "error", "message": "Search failed", "path": path}
 
-        return {
+        response = {
             "status": "search_result",
             "output": (result.stdout or "") + (result.stderr or ""),
             "path": path,
         }
+        if result.returncode == 0:
+            self._search_cache[key] = (time.monotonic(), dict(response, path=str(path)))
+            while len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return response
 
-    def start_import(self, path):
+    async def start_import(self, path, on_line=None):
         """
         Start an import and parse the output to build the canonical structure.
         This function returns the canonical dict and also sets manager.current_import.
+        on_line, if given, receives every beet output line while the import runs.
         """
+        async with self.import_lock:
+            return await self._start_import(path, on_line)
+
+    async def _start_import(self, path, on_line=None):
         beet_path = self.translate_path_for_beet(path)
         if BEET_PRETEND:
             pretend = "--pretend"
         else:
             pretend = "-t"
-        result = self._run_command(["beet", "-vv", "import", pretend, beet_path], timeout=300)
+            self.clear_search_cache()
+        result = await self._run_command(
+            ["beet", "-vv", "import", pretend, beet_path],
+            timeout=300,
+            on_line=on_line,
+        )
 
         if not result:
             parsed = {
@@ -191,14 +637,14 @@ class BeetImportManager:
             self.current_import = parsed
             return parsed
         logger.debug('pre parseoutput')
-        parsed = parse_beet_output(result.stdout, result.stderr, path)
+        parsed = parse_beet_output(result.stdout, result.stderr, path, pre_cleaned=True)
         # Persist parsed into manager state
         self.current_import = parsed
         self.save_state()
         return parsed
 
 
-    def import_with_id(self, path, id=None, auto_apply=False):
+    async def import_with_id(self, path, id=None, auto_apply=False):
         """
         Import a release by specifying a MusicBrainz or Discogs ID.
         If auto_apply is False we run beet and send the 'B' (abort) to get a preview,
@@ -211,6 +657,10 @@ class BeetImportManager:
             - output: str (raw beet output)
             - preview: dict (parsed preview if status='needs_confirmation')
         """
+        async with self.import_lock:
+            return await self._import_with_id(path, id, auto_apply)
+
+    async def _import_with_id(self, path, id=None, auto_apply=False):
         if not (id):
             return {
                 "status": "error",
@@ -224,13 +674,14 @@ class BeetImportManager:
             pretend = "--pretend"
         else:
             pretend = "-t"
+            self.clear_search_cache()
 
         beet_args = ["beet", "import", pretend, "--search-id", id, beet_path]
 
         # Use "A" to accept, "B" to cancel/preview
         stdin_input = "A\n" if auto_apply else "B\n"
 
-        result = self._run_command(
+        result = await self._run_command(
             beet_args,
             input_data=stdin_input,
             timeout=300,
@@ -277,7 +728,7 @@ class BeetImportManager:
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # Case 2: Preview mode (auto_apply=False)
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        parsed_preview = parse_beet_output(result.stdout, result.stderr, path)
+        parsed_preview = parse_beet_output(result.stdout, result.stderr, path, pre_cleaned=True)
 
         # ✅ KEY CHANGE: DON'T overwrite self.current_import during preview
         # The original state with candidates must remain intact until confirmation
@@ -301,34 +752,36 @@ class BeetImportManager:
     # ======================================================
     # FILE MANAGEMENT
     # ======================================================
-    def delete_directory(self, path):
+    async def delete_directory(self, path):
         """Delete a directory safely"""
         err = self._validate_path(path)
         if err:
             return {"status": "error", "message": err}
 
         try:
-            shutil.rmtree(path)
+            if os.name == "posix" and _RM_BIN:
+                # rm -rf unlinks in C, far quicker than rmtree for big albums
+                proc = await asyncio.create_subprocess_exec(
+                    _RM_BIN, "-rf", "--", path,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                _, stderr = await proc.communicate()
+                if proc.returncode != 0:
+                    raise OSError(stderr.decode(errors="replace").strip() or f"rm exited {proc.returncode}")
+            else:
+                await asyncio.to_thread(shutil.rmtree, path)
+            self.invalidate_dirs_cache()
             return {"status": "success", "message": Path(path).name}
         except Exception as e:
             logger.error(f"Failed to delete directory: {e}")
             return {"status": "error", "message": str(e)}
 
-    def skip_item(self, path):
+    async def skip_item(self, path):
         """Move a directory to 'skipped' folder"""
-        skip_dir = Path(IMPORT_PATH) / "skipped"
-        skip_dir.mkdir(exist_ok=True)
-        src = Path(path)
-        dst = skip_dir / src.name
-
-        # Rename if conflict
-        counter = 1
-        while dst.exists():
-            dst = skip_dir / f"{src.name}_{counter}"
-            counter += 1
-
         try:
-            shutil.move(str(src), str(dst))
+            dst = await asyncio.to_thread(_move_unique, Path(path), self._SKIPPED)
+            self.invalidate_dirs_cache()
             return {"status": "success", "message": f"Moved to {dst.name}"}
         except Exception as e:
             logger.error(f"Skip failed: {e}")
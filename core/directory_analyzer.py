@@ -1,51 +1,154 @@
 """
 Music directory analyzer (refactored)
 """
+import os
 import re
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from config import AUDIO_EXTENSIONS, IMAGE_EXTENSIONS
 
 # Includiamo anche PDF e futuri tipi di media
-MEDIA_EXTENSIONS = set(IMAGE_EXTENSIONS) | {'.pdf'}
+MEDIA_EXTENSIONS = IMAGE_EXTENSIONS | {'.pdf'}
+
+# Suffix tuples for str.endswith (longest first)
+_AUDIO_SUFFIXES = tuple(sorted(AUDIO_EXTENSIONS, key=len, reverse=True))
+_MEDIA_SUFFIXES = tuple(sorted(MEDIA_EXTENSIONS, key=len, reverse=True))
+
+# Precompiled patterns
+_DISC_RE = re.compile(r'(cd|disc|disk)\s*\d+', re.IGNORECASE)
+_PAREN_RE = re.compile(r'[\(\[].*?[\)\]]')
+_NON_WORD_RE = re.compile(r'[^\w\s-]')
+# ASCII symbols/control chars -> space (same set as _NON_WORD_RE, for ASCII names)
+_QUERY_TRANS = str.maketrans({
+    chr(c): ' ' for c in range(128)
+    if not (chr(c).isalnum() or chr(c) in ' -_')
+})
 
 # ======================================================
 # 🔧 HELPERS
 # ======================================================
 
-def _collect_files(path: Path, extensions: set, recursive: bool = True):
+def _scan_files(path, recursive: bool = True):
     """
-    Collect files matching a set of extensions.
-    Returns a list of dicts with name, size, and path.
+    Yield (DirEntry, lowercase name) for every file under path.
+    DirEntry caches type/stat info, so no extra syscalls per file.
     """
-    search = path.rglob('*') if recursive else path.glob('*')
-    files = []
-    for f in search:
-        if f.is_file() and f.suffix.lower() in extensions:
-            files.append({
-                'name': f.name,
-                'size': f.stat().st_size,
-                'path': str(f)
-            })
-    return sorted(files, key=lambda f: f['name'].lower())
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry, entry.name.lower()
+        except OSError:
+            continue
 
 
 def _detect_disc_subdirs(subdirs):
     """Detect if the directory contains multi-disc folders (CD1, Disc 2, etc.)."""
-    disc_pattern = re.compile(r'(cd|disc|disk)\s*\d+', re.IGNORECASE)
-    return [d for d in subdirs if disc_pattern.search(d.name)]
+    return [d for d in subdirs if _DISC_RE.search(d.name)]
 
 
 # ======================================================
 # 🎵 MAIN ANALYSIS
 # ======================================================
 
+def _walk(path: Path, recursive: bool = True):
+    """
+    Single scandir pass over path.
+    Returns (subdirs, audio, media, audio_bytes) where audio/media map the
+    top-level subfolder name (None for files in path itself) to lists of
+    file dicts and audio_bytes maps it to the summed audio size.
+    """
+    subdirs = []
+    audio = {}
+    media = {}
+    audio_bytes = {}
+    stack = [(str(path), None)]
+    while stack:
+        current, top = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if top is None:
+                            subdirs.append(Path(entry.path))
+                        if recursive:
+                            stack.append((entry.path, entry.name if top is None else top))
+                        continue
+                    if not entry.is_file():
+                        continue
+                    low = entry.name.lower()
+                    if low.endswith(_AUDIO_SUFFIXES):
+                        size = entry.stat().st_size
+                        audio.setdefault(top, []).append({
+                            'name': entry.name,
+                            'size': size,
+                            'path': entry.path
+                        })
+                        audio_bytes[top] = audio_bytes.get(top, 0) + size
+                    elif low.endswith(_MEDIA_SUFFIXES):
+                        media.setdefault(top, []).append({
+                            'name': entry.name,
+                            'size': entry.stat().st_size,
+                            'path': entry.path,
+                            'type': 'pdf' if low.endswith('.pdf') else 'image'
+                        })
+        except OSError:
+            continue
+    return subdirs, audio, media, audio_bytes
+
+
+def _walk_parallel(path: Path):
+    """
+    Same result as _walk(path), but top-level subfolders (discs) are walked
+    concurrently: scandir/stat release the GIL, so slow mounts overlap.
+    """
+    subdirs, audio, media, audio_bytes = _walk(path, recursive=False)
+    if not subdirs:
+        return subdirs, audio, media, audio_bytes
+
+    if len(subdirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(subdirs))) as ex:
+            results = list(ex.map(_walk, subdirs))
+    else:
+        results = [_walk(subdirs[0])]
+
+    for sub, (_, sub_audio, sub_media, sub_bytes) in zip(subdirs, results):
+        if sub_audio:
+            audio[sub.name] = [f for files in sub_audio.values() for f in files]
+            audio_bytes[sub.name] = sum(sub_bytes.values())
+        if sub_media:
+            media[sub.name] = [f for files in sub_media.values() for f in files]
+    return subdirs, audio, media, audio_bytes
+
+
+def _by_name(files):
+    return sorted(files, key=lambda f: f['name'].lower())
+
+
+def _dir_info(audio_files, media_files, total_size):
+    audio_files = _by_name(audio_files)
+    return {
+        'audio_files': audio_files,
+        'images': _by_name(media_files),
+        'audio_count': len(audio_files),
+        'total_size': total_size
+    }
+
+
 def analyze_directory(path: str):
     """
     Analyzes a directory to understand its content and structure.
     Detects multi-disc layouts, audio files, images, and PDFs.
+    The tree is read once (subfolders in parallel); discs are carved out of that walk.
     """
     dir_path = Path(path)
-    subdirs = [d for d in dir_path.iterdir() if d.is_dir()]
+    subdirs, audio, media, audio_bytes = _walk_parallel(dir_path)
     disc_dirs = _detect_disc_subdirs(subdirs)
 
     # MULTI-DISC
@@ -54,48 +157,53 @@ def analyze_directory(path: str):
         structure = {'type': 'multi_disc', 'discs': []}
 
         for disc_dir in disc_dirs:
-            disc_info = analyze_single_dir(disc_dir)
+            disc_info = _dir_info(
+                audio.get(disc_dir.name, []),
+                media.get(disc_dir.name, []),
+                audio_bytes.get(disc_dir.name, 0),
+            )
             disc_info['name'] = disc_dir.name
             structure['discs'].append(disc_info)
 
-        # Include images/PDFs from root
-        structure['images'] = find_media(dir_path, recursive=True)
+        # Include images/PDFs from root (whole tree)
+        structure['images'] = _by_name(f for files in media.values() for f in files)
 
     # SINGLE DISC
     else:
-        structure = {'type': 'single', **analyze_single_dir(dir_path)}
+        structure = {
+            'type': 'single',
+            **_dir_info(
+                [f for files in audio.values() for f in files],
+                [f for files in media.values() for f in files],
+                sum(audio_bytes.values()),
+            )
+        }
 
     return structure
 
 
 def analyze_single_dir(path: Path):
     """Analyze a single album directory for audio and media content."""
-    audio_files = _collect_files(path, AUDIO_EXTENSIONS, recursive=True)
-    media_files = find_media(path, recursive=True)
-
-    return {
-        'audio_files': audio_files,
-        'images': media_files,
-        'audio_count': len(audio_files),
-        'total_size': sum(f['size'] for f in audio_files)
-    }
+    _, audio, media, audio_bytes = _walk(path)
+    return _dir_info(
+        [f for files in audio.values() for f in files],
+        [f for files in media.values() for f in files],
+        sum(audio_bytes.values()),
+    )
 
 
 def find_media(path: Path, recursive: bool = True):
     """Find images and PDF files within a directory."""
-    media = []
-    search = path.rglob('*') if recursive else path.glob('*')
-
-    for f in search:
-        if f.is_file():
-            ext = f.suffix.lower()
-            if ext in MEDIA_EXTENSIONS:
-                media.append({
-                    'name': f.name,
-                    'size': f.stat().st_size,
-                    'path': str(f),
-                    'type': 'pdf' if ext == '.pdf' else 'image'
-                })
+    media = [
+        {
+            'name': entry.name,
+            'size': entry.stat().st_size,
+            'path': entry.path,
+            'type': 'pdf' if low.endswith('.pdf') else 'image'
+        }
+        for entry, low in _scan_files(path, recursive)
+        if low.endswith(_MEDIA_SUFFIXES)
+    ]
 
     return sorted(media, key=lambda m: m['name'].lower())
 
@@ -104,13 +212,17 @@ def find_media(path: Path, recursive: bool = True):
 # 🔍 QUERY HELPERS
 # ======================================================
 
+@functools.lru_cache(maxsize=512)
 def get_search_query(path: str):
     """
     Generate a clean, normalized search query string
     from a directory name (for MusicBrainz/Discogs).
     """
-    dir_name = Path(path).name
-    cleaned = re.sub(r'[\(\[].*?[\)\]]', '', dir_name)  # remove (...) and [...]
-    cleaned = re.sub(r'[^\w\s-]', ' ', cleaned)         # keep alphanumerics/spaces/hyphens
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-    return cleaned
\ No newline at end of file
+    dir_name = os.path.basename(path.rstrip(os.sep))
+    cleaned = _PAREN_RE.sub('', dir_name)  # remove (...) and [...]
+    # keep alphanumerics/spaces/hyphens
+    if cleaned.isascii():
+        cleaned = cleaned.translate(_QUERY_TRANS)
+    else:
+        cleaned = _NON_WORD_RE.sub(' ', cleaned)
+    return ' '.join(cleaned.split())
\ No newline at end of file
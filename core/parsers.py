@@ -17,11 +17,16 @@ Return schema example:
 """
 
 import re
-import datetime
+import time
+import functools
+import unicodedata
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from difflib import SequenceMatcher
-from telegram.helpers import escape_markdown
+try:
+    from rapidfuzz.distance import Indel, Levenshtein
+except ImportError:  # optional speedup, fall back to difflib
+    Indel = Levenshtein = None
 from config import setup_logging, BEET_DEBUG_MODE
 
 logger = setup_logging()
@@ -31,14 +36,34 @@ logger = setup_logging()
 # ANSI CODES CLEANUP
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+_ANSI_RE = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
+
+
 def clean_ansi_codes(s: str) -> str:
     """Remove ANSI escape codes from string."""
     if not s:
         return ''
-    ansi_re = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
-    return ansi_re.sub('', s)
-
-
+    if '\x1b' not in s:
+        return s
+    return _ANSI_RE.sub('', s)
+
+
+_NON_WORD_RE = re.compile(r'[^\w\s-]')
+_WS_RE = re.compile(r'\s+')
+# ASCII symbols/control chars -> space (what _NON_WORD_RE removes, for ASCII titles)
+_ASCII_NON_WORD_TRANS = str.maketrans({
+    chr(c): ' ' for c in range(128)
+    if not (chr(c).isalnum() or chr(c) in ' -_')
+})
+# Unicode hyphens/dashes and quotes -> ASCII
+_UNICODE_FOLD_TABLE = str.maketrans({
+    '‐': '-', '–': '-', '—': '-',
+    '‘': "'", '’': "'",
+    '“': '"', '”': '"',
+})
+
+
+@functools.lru_cache(maxsize=1024)
 def normalize_title(title: str) -> str:
     """
     Normalize a title for robust fuzzy matching.
@@ -47,24 +72,23 @@ def normalize_title(title: str) -> str:
     if not title:
         return ''
 
-    # Replace various Unicode hyphens/dashes with ASCII hyphen
-    title = title.replace('‐', '-').replace('–', '-').replace('—', '-')
+    # ASCII titles (the common case): symbols -> space via one translate, no regex
+    if title.isascii():
+        return ' '.join(title.lower().translate(_ASCII_NON_WORD_TRANS).split())
 
-    # Replace Unicode quotes
-    #title = title.replace(''', "'").replace(''', "'")
-    #title = title.replace('"', '"').replace('"', '"')
-    title = title.replace('‘', "'").replace('’', "'")
-    title = title.replace('“', '"').replace('”', '"')
+    # Compatibility forms (fullwidth, ligatures, composed accents), then
+    # Unicode hyphens/dashes and quotes to ASCII
+    title = unicodedata.normalize('NFKC', title).translate(_UNICODE_FOLD_TABLE)
 
-    # Lowercase
-    title = title.lower()
+    # Lowercase (casefold also handles ß, final sigma, ...)
+    title = title.casefold()
 
     # Remove common noise words and punctuation for matching
     # Keep letters, numbers, spaces, hyphens
-    title = re.sub(r'[^\w\s-]', ' ', title)
+    title = _NON_WORD_RE.sub(' ', title)
 
     # Normalize whitespace
-    title = re.sub(r'\s+', ' ', title).strip()
+    title = _WS_RE.sub(' ', title).strip()
 
     return title
 
@@ -73,9 +97,17 @@ def normalize_title(title: str) -> str:
 # ID EXTRACTION HELPERS
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+# MusicBrainz UUID, shared by the ID extractors and candidate parsers
+_MB_UUID = r'[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}'
+_MB_UUID_RE = re.compile(r'(' + _MB_UUID + r')', re.IGNORECASE)
+_DISCOGS_URL_RE = re.compile(r'discogs\.com/(?:release|master)/(\d+)', re.IGNORECASE)
+_DISCOGS_CONTEXT_ID_RE = re.compile(r'discogs[^\d]{0,20}([rm]\d{6,})', re.IGNORECASE)
+_DISCOGS_BARE_ID_RE = re.compile(r'\b([rm]\d{6,})\b', re.IGNORECASE)
+
+
 def extract_musicbrainz_id(text: str) -> Optional[str]:
     """Extract MusicBrainz release ID (UUID format)."""
-    match = re.search(r'([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})', text, re.IGNORECASE)
+    match = _MB_UUID_RE.search(text)
     return match.group(1) if match else None
 
 
@@ -105,17 +137,17 @@ def extract_musicbrainz_id(text: str) -> Optional[str]:
 #     return None
 def extract_discogs_id(text: str) -> Optional[str]:
     # Try URL format first (most reliable)
-    match = re.search(r'discogs\.com/(?:release|master)/(\d+)', text, re.IGNORECASE)
+    match = _DISCOGS_URL_RE.search(text)
     if match:
         return f"r{match.group(1)}"
 
     # Try explicit Discogs context
-    match = re.search(r'discogs[^\d]{0,20}([rm]\d{6,})', text, re.IGNORECASE)
+    match = _DISCOGS_CONTEXT_ID_RE.search(text)
     if match:
         return match.group(1).lower()
 
     # Last resort: standalone r/m followed by 6+ digits
-    match = re.search(r'\b([rm]\d{6,})\b', text, re.IGNORECASE)
+    match = _DISCOGS_BARE_ID_RE.search(text)
     if match:
         return match.group(1).lower()
 
@@ -147,13 +179,29 @@ def build_url_from_id(source: str, id_value: str) -> Optional[str]:
 # CHARACTER-LEVEL DIFF FORMATTING
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+# MarkdownV2 special characters, backslash-escaped in one translate pass
+# (same set as telegram.helpers.escape_markdown(version=2))
+_MDV2_TRANS = str.maketrans({c: '\\' + c for c in r'\_*[]()~`>#+-=|{}.!'})
+
+
 def escape_md(text: str) -> str:
     if not text:
         return ""
-    return escape_markdown(text, version=2)
+    return text.translate(_MDV2_TRANS)
 
 import difflib
 
+def _opcodes(a, b, replace: bool = False):
+    """
+    (tag, i1, i2, j1, j2) edit opcodes between two sequences (rapidfuzz when available).
+    replace=True uses Levenshtein, so substitutions come out as 'replace'
+    instead of a delete + insert pair.
+    """
+    if Indel is not None:
+        return (Levenshtein if replace else Indel).opcodes(a, b)
+    return SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+
+
 def char_diff(old: str, new: str) -> Tuple[str, str]:
     """
     Create character-level diff highlighting exact changes.
@@ -168,12 +216,14 @@ def char_diff(old: str, new: str) -> Tuple[str, str]:
             f"__*{escape_md(new or '')}*__" if new else ""
         )
 
-    matcher = SequenceMatcher(None, old, new)
+    if old == new:
+        escaped = escape_md(old)
+        return escaped, escaped
 
     old_parts = []
     new_parts = []
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    for tag, i1, i2, j1, j2 in _opcodes(old, new, replace=True):
         old_chunk = old[i1:i2]
         new_chunk = new[j1:j2]
 
@@ -229,12 +279,14 @@ def word_diff(old: str, new: str) -> Tuple[str, str]:
     old_words = old.split()
     new_words = new.split()
 
-    matcher = SequenceMatcher(None, old_words, new_words)
+    if old_words == new_words:
+        escaped = ' '.join(escape_md(w) for w in old_words)
+        return escaped, escaped
 
     old_parts = []
     new_parts = []
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    for tag, i1, i2, j1, j2 in _opcodes(old_words, new_words):
         old_chunk = old_words[i1:i2]
         new_chunk = new_words[j1:j2]
 
@@ -255,6 +307,10 @@ def word_diff(old: str, new: str) -> Tuple[str, str]:
     return ' '.join(old_parts), ' '.join(new_parts)
 
 
+_TIMECODE_RE = re.compile(r"\b\d{1,2}:\d{1,2}\b")
+_TRACKNUM_RE = re.compile(r"\(#\d+\)")
+
+
 def smart_diff(old: str, new: str, char_threshold: int = 100) -> Tuple[str, str]:
     """
     Intelligently choose between character-level and word-level diff.
@@ -278,8 +334,9 @@ def smart_diff(old: str, new: str, char_threshold: int = 100) -> Tuple[str, str]
     # Prefer word-level diffs for strings that contain track/time patterns
     # or numbered track markers, which tend to split oddly with
     # character-level diffs (e.g. "(#4) ... 5:17").
-    timecode_re = re.search(r"\b\d{1,2}:\d{1,2}\b", (old or "") + " " + (new or ""))
-    tracknum_re = re.search(r"\(#\d+\)", (old or "") + " " + (new or ""))
+    both = (old or "") + " " + (new or "")
+    timecode_re = _TIMECODE_RE.search(both)
+    tracknum_re = _TRACKNUM_RE.search(both)
 
     if timecode_re or tracknum_re:
         return word_diff(old, new)
@@ -290,6 +347,22 @@ def smart_diff(old: str, new: str, char_threshold: int = 100) -> Tuple[str, str]
         return word_diff(old, new)
 
 
+# Difference line patterns (see parse_and_format_difference)
+_DIFF_TRACK_RE = re.compile(
+    r'[≠!=]\s*(\(#\d+\).+?)\s*->\s*(\(#\d+\).+?)$',
+    re.IGNORECASE
+)
+_DIFF_FIELD_ARROW_RE = re.compile(
+    r'[≠!=]\s*(.+?):\s*(.+?)\s*(?:->|→)\s*(.+?)$',
+    re.IGNORECASE
+)
+_DIFF_PARENTHESIS_RE = re.compile(
+    r'[≠!=]\s*(.+?)\s*\((.+?)\s*(?:->|→|vs)\s*(.+?)\)',
+    re.IGNORECASE
+)
+_DIFF_ASTERISK_RE = re.compile(r'\*\s*(.+?):\s*(.+)', re.IGNORECASE)
+
+
 def parse_and_format_difference(diff_line: str) -> Dict[str, Any]:
     """
     Parse a difference line from beet output and return structured info.
@@ -321,14 +394,14 @@ def parse_and_format_difference(diff_line: str) -> Dict[str, Any]:
         'raw': cleaned
     }
 
+    # Patterns 1-3 all need a ≠ / ! / = marker (pattern 4 a '*');
+    # lines without one only get the cheap substring checks below
+    has_marker = '≠' in cleaned or '!' in cleaned or '=' in cleaned
+
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Pattern 1: Track changes with format "≠ (#N) Title (duration) -> (#N) Title (duration)"
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    track_pattern = re.compile(
-        r'[≠!=]\s*(\(#\d+\).+?)\s*->\s*(\(#\d+\).+?)$',
-        re.IGNORECASE
-    )
-    if m := track_pattern.search(cleaned):
+    if has_marker and (m := _DIFF_TRACK_RE.search(cleaned)):
         result['type'] = 'field_change'
         result['field'] = 'track'
         result['old_value'] = m.group(1).strip()
@@ -338,11 +411,7 @@ def parse_and_format_difference(diff_line: str) -> Dict[str, Any]:
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Pattern 2: Field with arrow but NO parentheses "≠ Field: Old -> New"
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    field_arrow_pattern = re.compile(
-        r'[≠!=]\s*(.+?):\s*(.+?)\s*(?:->|→)\s*(.+?)$',
-        re.IGNORECASE
-    )
-    if m := field_arrow_pattern.search(cleaned):
+    if has_marker and (m := _DIFF_FIELD_ARROW_RE.search(cleaned)):
         result['type'] = 'field_change'
         result['field'] = m.group(1).strip()
         result['old_value'] = m.group(2).strip()
@@ -352,11 +421,7 @@ def parse_and_format_difference(diff_line: str) -> Dict[str, Any]:
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Pattern 3: Field with parentheses "≠ field (old -> new)"
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    parenthesis_pattern = re.compile(
-        r'[≠!=]\s*(.+?)\s*\((.+?)\s*(?:->|→|vs)\s*(.+?)\)',
-        re.IGNORECASE
-    )
-    if m := parenthesis_pattern.search(cleaned):
+    if has_marker and (m := _DIFF_PARENTHESIS_RE.search(cleaned)):
         result['type'] = 'field_change'
         result['field'] = m.group(1).strip()
         result['old_value'] = m.group(2).strip()
@@ -366,8 +431,7 @@ def parse_and_format_difference(diff_line: str) -> Dict[str, Any]:
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Pattern 4: "* Field: value" (new value only)
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    asterisk_pattern = re.compile(r'\*\s*(.+?):\s*(.+)', re.IGNORECASE)
-    if m := asterisk_pattern.search(cleaned):
+    if '*' in cleaned and (m := _DIFF_ASTERISK_RE.search(cleaned)):
         result['type'] = 'field_change'
         result['field'] = m.group(1).strip()
         result['new_value'] = m.group(2).strip()
@@ -376,12 +440,13 @@ def parse_and_format_difference(diff_line: str) -> Dict[str, Any]:
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Pattern 5: "missing tracks" / "extra tracks" / "unmatched tracks"
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    if 'missing' in cleaned.lower():
+    lowered = cleaned.lower()
+    if 'missing' in lowered:
         result['type'] = 'missing'
         result['field'] = cleaned.replace('missing', '').strip()
         return result
 
-    if 'extra' in cleaned.lower() or 'unmatched' in cleaned.lower():
+    if 'extra' in lowered or 'unmatched' in lowered:
         result['type'] = 'extra'
         result['field'] = cleaned.replace('extra', '').replace('unmatched', '').strip()
         return result
@@ -486,13 +551,37 @@ def format_difference_with_diff(diff: str, style: str = 'smart') -> str:
 # SINGLE MATCH PARSER
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-def parse_beet_match_info(output: str) -> Dict[str, Any]:
+_SIM_RE = re.compile(r'Match\s*\(?\s*([\d.]+)%', re.IGNORECASE)
+# Metadata line prefixes ("MusicBrainz, ..." / "Discogs, ..."), compared lowercased
+_SOURCE_LINE_PREFIXES = ('musicbrainz', 'discogs')
+_MATCH_HEADER_RE = re.compile(
+    r'^\s*Match\s*\([\d.]+%?\):\s*\n\s*([^-\n]+?)\s*-\s*([^\n]+)',
+    re.MULTILINE
+)
+_MATCH_FIELD_MARKERS = (
+    ('* Artist:', 'artist'),
+    ('* Album:', 'album'),
+    ('* Title:', 'title'),
+)
+
+
+# Placeholder values beet prints for empty metadata fields
+_EMPTY_META_VALUES = frozenset(('none', 'n/a', ''))
+
+
+def _meta_value(parts: List[str], i: int) -> Optional[str]:
+    """parts[i] of a split metadata line, or None if missing/placeholder"""
+    if i < len(parts) and parts[i].lower() not in _EMPTY_META_VALUES:
+        return parts[i]
+    return None
+
+def parse_beet_match_info(output: str, pre_cleaned: bool = False) -> Dict[str, Any]:
     """
     Extract detailed match information from beet output for single match case.
     Returns a dict with fields used by the UI.
     Supports both MusicBrainz and Discogs.
     """
-    cleaned = clean_ansi_codes(output or "")
+    cleaned = (output or "") if pre_cleaned else clean_ansi_codes(output or "")
     info = {
         'similarity': None,
         'artist': None,
@@ -511,38 +600,58 @@ def parse_beet_match_info(output: str) -> Dict[str, Any]:
     }
 
     # Similarity (e.g. "Match (92.3%)" or "Match 92%")
-    if m := re.search(r'Match\s*\(?\s*([\d.]+)%', cleaned, re.IGNORECASE):
+    if m := _SIM_RE.search(cleaned):
         info['similarity'] = float(m.group(1))
 
-    # --- Parse metadata lines early to detect explicit source preference ---
-    # MusicBrainz/Discogs metadata line formats are preferred to decide which
-    # source the match should be considered from (user-visible). We parse
-    # these first so that an incidental UUID elsewhere doesn't override a
-    # clear "Discogs, ..." metadata line.
+    # --- Single pass over the lines ---
+    # Collect the first "MusicBrainz/Discogs, ..." metadata line, the
+    # "* Field:" overrides (last one wins) and the difference lines.
+    source_line = None
+    overrides = {}
+    differences = info['differences']
     for line in cleaned.splitlines():
         line = line.strip()
-        if re.match(r'^(MusicBrainz|Discogs)', line, re.IGNORECASE):
-            parts = [p.strip() for p in line.split(',')]
+        if not line:
+            continue
+
+        if source_line is None and line[:11].lower().startswith(_SOURCE_LINE_PREFIXES):
+            source_line = line
+
+        if '* ' in line:
+            for marker, key in _MATCH_FIELD_MARKERS:
+                if marker in line:
+                    overrides[key] = line.split(marker, 1)[1].strip()
+                    break
+            else:
+                if '≠' in line or '!=' in line:
+                    differences.append(line)
+        elif '≠' in line or '!=' in line:
+            differences.append(line)
 
-            # If the metadata line explicitly says 'Discogs' we prefer that
-            # as the source for display/selection purposes.
-            if parts[0].lower() == 'discogs':
-                info['source'] = 'discogs'
+    # Metadata line is applied first so that an incidental UUID elsewhere
+    # doesn't override a clear "Discogs, ..." metadata line.
+    # Format: "MusicBrainz, Format, Year, Country, Label, CatNo, ..."
+    # or:     "Discogs, Format, Year, Country, Label, CatNo, ..."
+    if source_line:
+        parts = [p.strip() for p in source_line.split(',')]
 
-            # Index mapping: Source, Format, Year, Country, Label, CatNo
-            if len(parts) >= 2 and parts[1].lower() not in ('none', 'n/a', ''):
-                info['format'] = parts[1]
+        # If the metadata line explicitly says 'Discogs' we prefer that
+        # as the source for display/selection purposes.
+        if parts[0].lower() == 'discogs':
+            info['source'] = 'discogs'
 
-            if len(parts) >= 3 and parts[2].isdigit():
-                info['year'] = parts[2]
+        # Index mapping: Source, Format, Year, Country, Label, CatNo
+        if (value := _meta_value(parts, 1)) is not None:
+            info['format'] = value
 
-            if len(parts) >= 5 and parts[4].lower() not in ('none', 'n/a', ''):
-                info['label'] = parts[4]
+        if len(parts) >= 3 and parts[2].isdigit():
+            info['year'] = parts[2]
 
-            if len(parts) >= 6 and parts[5].lower() not in ('none', 'n/a', ''):
-                info['catalog_num'] = parts[5]
+        if (value := _meta_value(parts, 4)) is not None:
+            info['label'] = value
 
-            break
+        if (value := _meta_value(parts, 5)) is not None:
+            info['catalog_num'] = value
 
     # MusicBrainz ID
     mb_id = extract_musicbrainz_id(cleaned)
@@ -564,55 +673,12 @@ def parse_beet_match_info(output: str) -> Dict[str, Any]:
 
     # Extract Artist and Album from main match line
     # Pattern: "Match (X%):\n  Artist - Album"
-    if match_line := re.search(
-        r'^\s*Match\s*\([\d.]+%?\):\s*\n\s*([^-\n]+?)\s*-\s*([^\n]+)',
-        cleaned,
-        re.MULTILINE
-    ):
-        if not info['artist']:
-            info['artist'] = match_line.group(1).strip()
-        if not info['album']:
-            info['album'] = match_line.group(2).strip()
-
-    # Extract metadata from structured line
-    # Format: "MusicBrainz, Format, Year, Country, Label, CatNo, ..."
-    # or:     "Discogs, Format, Year, Country, Label, CatNo, ..."
-    for line in cleaned.splitlines():
-        line = line.strip()
-        if re.match(r'^(MusicBrainz|Discogs)', line, re.IGNORECASE):
-            parts = [p.strip() for p in line.split(',')]
-
-            # Detect source from this line if not already set
-            if parts[0].lower() == 'discogs' and not info['source']:
-                info['source'] = 'discogs'
-
-            # Index mapping: Source, Format, Year, Country, Label, CatNo
-            if len(parts) >= 2 and parts[1].lower() not in ('none', 'n/a', ''):
-                info['format'] = parts[1]
+    if match_line := _MATCH_HEADER_RE.search(cleaned):
+        info['artist'] = match_line.group(1).strip()
+        info['album'] = match_line.group(2).strip()
 
-            if len(parts) >= 3 and parts[2].isdigit():
-                info['year'] = parts[2]
-
-            if len(parts) >= 5 and parts[4].lower() not in ('none', 'n/a', ''):
-                info['label'] = parts[4]
-
-            if len(parts) >= 6 and parts[5].lower() not in ('none', 'n/a', ''):
-                info['catalog_num'] = parts[5]
-
-            break
-
-    # Extract differences and override artist/album/title if present
-    for line in cleaned.splitlines():
-        line = line.strip()
-
-        if '* Artist:' in line:
-            info['artist'] = line.split('* Artist:', 1)[1].strip()
-        elif '* Album:' in line:
-            info['album'] = line.split('* Album:', 1)[1].strip()
-        elif '* Title:' in line:
-            info['title'] = line.split('* Title:', 1)[1].strip()
-        elif '≠' in line or '!=' in line:
-            info['differences'].append(clean_ansi_codes(line.strip()))
+    # "* Artist:" / "* Album:" / "* Title:" lines override the match line
+    info.update(overrides)
 
     return info
 
@@ -621,6 +687,63 @@ def parse_beet_match_info(output: str) -> Dict[str, Any]:
 # MULTIPLE CANDIDATES PARSER (VERBOSE MODE)
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+# Verbose "Candidate: ... (id) ... Distance: X" entries
+_CAND_MB_RE = re.compile(
+    r'Candidate:\s*(.+?)\s*\((' + _MB_UUID + r')\)\s*\n'
+    r'.*?Distance:\s*([\d.]+)',
+    re.DOTALL | re.IGNORECASE
+)
+_CAND_MB_LOOSE_RE = re.compile(
+    r'Candidate:\s*(.+?)\s*\(([a-f0-9-]{36})\)\s*\n'
+    r'.*?Distance:\s*([\d.]+)',
+    re.DOTALL | re.IGNORECASE
+)
+# Discogs with r/m prefix: (r1234567) or (m1234567)
+_CAND_DISCOGS_PREFIXED_RE = re.compile(
+    r'Candidate:\s*(.+?)\s*\(([rm]\d+)\)\s*\n'
+    r'.*?Distance:\s*([\d.]+)',
+    re.DOTALL | re.IGNORECASE
+)
+# Discogs pure number: (1234567), note 'discogs:' prefix in verbose mode
+# (matched as 'discogs:' + _CAND_DISCOGS_PURE_RE, see _finditer_discogs_pure)
+_DISCOGS_PREFIX_RE = re.compile(r'discogs:', re.IGNORECASE)
+_CAND_DISCOGS_PURE_RE = re.compile(
+    r'Candidate:\s*(.+?)\s*\((\d{6,})\)\s*\n'
+    r'.*?Distance:\s*([\d.]+)',
+    re.DOTALL | re.IGNORECASE
+)
+_DISCOGS_API_CALL_RE = re.compile(
+    r'discogs:\s*Getting\s+(?:master|release)\s+release\s+(\d+)',
+    re.IGNORECASE
+)
+# User-friendly candidate block:
+# 1. (35.7%) Artist - Album
+#            ≠ differences...
+#            MusicBrainz, Format, Year, Country, Label, CatNo, ...
+_CANDIDATE_BLOCK_RE = re.compile(
+    r'^\s*(\d+)\.\s*\(([\d.]+)%\)\s*(.+?)\s*\n'  # Number, similarity, artist-album
+    r'\s*≠\s*(.+?)\s*\n'                         # Differences line
+    r'\s*(MusicBrainz|Discogs),\s*(.+?)(?=\n\s*\d+\.|$)',  # Metadata line
+    re.MULTILINE | re.IGNORECASE | re.DOTALL
+)
+
+
+
+def _finditer_discogs_pure(cleaned: str):
+    """
+    Same matches as finditer(r'discogs:.*?' + _CAND_DISCOGS_PURE_RE) in linear time.
+    The combined pattern retried from every 'discogs:' and rescanned the rest
+    of the output each time; here the candidate is searched once per prefix,
+    and a miss means no later prefix can match either.
+    """
+    pos = 0
+    while prefix := _DISCOGS_PREFIX_RE.search(cleaned, pos):
+        match = _CAND_DISCOGS_PURE_RE.search(cleaned, prefix.end())
+        if not match:
+            return
+        yield match
+        pos = match.end()
+
 def parse_verbose_candidates_1(output: str) -> List[Dict[str, Any]]:
     """
     Two-phase parser for verbose beet output with multiple candidates.
@@ -643,13 +766,7 @@ def parse_verbose_candidates_1(output: str) -> List[Dict[str, Any]]:
     id_map = {}  # Map: normalized_title -> (source, id_value, distance)
 
     # MusicBrainz candidates
-    mb_pattern = re.compile(
-        r'Candidate:\s*(.+?)\s*\(([a-f0-9-]{36})\)\s*\n'
-        r'.*?Distance:\s*([\d.]+)',
-        re.DOTALL | re.IGNORECASE
-    )
-
-    for match in mb_pattern.finditer(cleaned):
+    for match in _CAND_MB_LOOSE_RE.finditer(cleaned):
         full_title = match.group(1).strip()
         mb_id = match.group(2)
         distance = float(match.group(3))
@@ -661,13 +778,7 @@ def parse_verbose_candidates_1(output: str) -> List[Dict[str, Any]]:
 
     # ✅ FIX: Discogs candidates - ENHANCED pattern for all formats
     # Pattern 1: With r/m prefix: (r1234567) or (m1234567)
-    discogs_pattern_prefixed = re.compile(
-        r'Candidate:\s*(.+?)\s*\(([rm]\d+)\)\s*\n'
-        r'.*?Distance:\s*([\d.]+)',
-        re.DOTALL | re.IGNORECASE
-    )
-
-    for match in discogs_pattern_prefixed.finditer(cleaned):
+    for match in _CAND_DISCOGS_PREFIXED_RE.finditer(cleaned):
         full_title = match.group(1).strip()
         discogs_id = match.group(2).lower()  # Already has r/m prefix
         distance = float(match.group(3))
@@ -679,13 +790,7 @@ def parse_verbose_candidates_1(output: str) -> List[Dict[str, Any]]:
 
     # ✅ FIX: Pattern 2: Pure number format: (1234567) - MOST COMMON
     # This catches the format you're seeing: "... (2965563)\n...Distance: 0.56"
-    discogs_pattern_pure = re.compile(
-        r'discogs:.*?Candidate:\s*(.+?)\s*\((\d{6,})\)\s*\n'  # Note 'discogs:' prefix in verbose mode
-        r'.*?Distance:\s*([\d.]+)',
-        re.DOTALL | re.IGNORECASE
-    )
-
-    for match in discogs_pattern_pure.finditer(cleaned):
+    for match in _finditer_discogs_pure(cleaned):
         full_title = match.group(1).strip()
         discogs_number = match.group(2)
         distance = float(match.group(3))
@@ -698,14 +803,10 @@ def parse_verbose_candidates_1(output: str) -> List[Dict[str, Any]]:
             logger.debug(f"Found Discogs ID (pure number): {discogs_id} for '{full_title}'")
 
     # ✅ FIX: Pattern 3: Fallback - any "Getting master release" line
-    discogs_master_pattern = re.compile(
-        r'discogs:\s*Getting\s+(?:master|release)\s+release\s+(\d+)',
-        re.IGNORECASE
-    )
 
     # Build a map of Discogs API calls to track which ID belongs to which candidate
     discogs_api_calls = []
-    for match in discogs_master_pattern.finditer(cleaned):
+    for match in _DISCOGS_API_CALL_RE.finditer(cleaned):
         discogs_number = match.group(1)
         discogs_api_calls.append(discogs_number)
         logger.debug(f"Found Discogs API call for ID: {discogs_number}")
@@ -718,14 +819,7 @@ def parse_verbose_candidates_1(output: str) -> List[Dict[str, Any]]:
     #            ≠ differences...
     #            MusicBrainz, Format, Year, Country, Label, CatNo, ...
 
-    block_pattern = re.compile(
-        r'^\s*(\d+)\.\s*\(([\d.]+)%\)\s*(.+?)\s*\n'  # Number, similarity, artist-album
-        r'\s*≠\s*(.+?)\s*\n'                         # Differences line
-        r'\s*(MusicBrainz|Discogs),\s*(.+?)(?=\n\s*\d+\.|$)',  # Metadata line
-        re.MULTILINE | re.IGNORECASE | re.DOTALL
-    )
-
-    for match in block_pattern.finditer(cleaned):
+    for match in _CANDIDATE_BLOCK_RE.finditer(cleaned):
         idx = int(match.group(1))
         similarity = float(match.group(2))
         artist_album = match.group(3).strip()
@@ -738,9 +832,9 @@ def parse_verbose_candidates_1(output: str) -> List[Dict[str, Any]]:
 
         format_ = parts[0] if len(parts) > 0 and parts[0].lower() != 'none' else None
         year = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else None
-        country = parts[2] if len(parts) > 2 and parts[2].lower() not in ('none', 'n/a', '') else None
-        label = parts[3] if len(parts) > 3 and parts[3].lower() not in ('none', 'n/a', '') else None
-        catno = parts[4] if len(parts) > 4 and parts[4].lower() not in ('none', 'n/a', '') else None
+        country = _meta_value(parts, 2)
+        label = _meta_value(parts, 3)
+        catno = _meta_value(parts, 4)
 
         # Split "Artist - Album"
         artist = artist_album
@@ -749,7 +843,7 @@ def parse_verbose_candidates_1(output: str) -> List[Dict[str, Any]]:
             artist, album = artist_album.split(' - ', 1)
 
         # Parse differences
-        differences = [d.strip() for d in differences_line.split(',') if d.strip()]
+        differences = [s for d in differences_line.split(',') if (s := d.strip())]
 
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # PHASE 3: Match with ID map using normalized title
@@ -849,12 +943,12 @@ def parse_verbose_candidates_1(output: str) -> List[Dict[str, Any]]:
     return candidates
 
 
-def parse_verbose_candidates(output: str) -> List[Dict[str, Any]]:
+def parse_verbose_candidates(output: str, pre_cleaned: bool = False) -> List[Dict[str, Any]]:
     """
     Two-phase parser for verbose beet output with multiple candidates.
     Enhanced to capture Discogs IDs in all formats.
     """
-    cleaned = clean_ansi_codes(output or "")
+    cleaned = (output or "") if pre_cleaned else clean_ansi_codes(output or "")
     candidates = []
 
     id_map = {}  # Map: normalized_title -> (source, id_value, distance)
@@ -864,13 +958,7 @@ def parse_verbose_candidates(output: str) -> List[Dict[str, Any]]:
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
     # MusicBrainz candidates (UUID format)
-    mb_pattern = re.compile(
-        r'Candidate:\s*(.+?)\s*\(([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})\)\s*\n'
-        r'.*?Distance:\s*([\d.]+)',
-        re.DOTALL | re.IGNORECASE
-    )
-
-    for match in mb_pattern.finditer(cleaned):
+    for match in _CAND_MB_RE.finditer(cleaned):
         full_title = match.group(1).strip()
         mb_id = match.group(2)
         distance = float(match.group(3))
@@ -882,13 +970,7 @@ def parse_verbose_candidates(output: str) -> List[Dict[str, Any]]:
 
     # ✅ FIX: Discogs candidates - ENHANCED pattern for all formats
     # Pattern 1: With r/m prefix: (r1234567) or (m1234567)
-    discogs_pattern_prefixed = re.compile(
-        r'Candidate:\s*(.+?)\s*\(([rm]\d+)\)\s*\n'
-        r'.*?Distance:\s*([\d.]+)',
-        re.DOTALL | re.IGNORECASE
-    )
-
-    for match in discogs_pattern_prefixed.finditer(cleaned):
+    for match in _CAND_DISCOGS_PREFIXED_RE.finditer(cleaned):
         full_title = match.group(1).strip()
         discogs_id = match.group(2).lower()  # Already has r/m prefix
         distance = float(match.group(3))
@@ -900,13 +982,7 @@ def parse_verbose_candidates(output: str) -> List[Dict[str, Any]]:
 
     # ✅ FIX: Pattern 2: Pure number format: (1234567) - MOST COMMON
     # This catches the format you're seeing: "... (2965563)\n...Distance: 0.56"
-    discogs_pattern_pure = re.compile(
-        r'discogs:.*?Candidate:\s*(.+?)\s*\((\d{6,})\)\s*\n'  # Note 'discogs:' prefix in verbose mode
-        r'.*?Distance:\s*([\d.]+)',
-        re.DOTALL | re.IGNORECASE
-    )
-
-    for match in discogs_pattern_pure.finditer(cleaned):
+    for match in _finditer_discogs_pure(cleaned):
         full_title = match.group(1).strip()
         discogs_number = match.group(2)
         distance = float(match.group(3))
@@ -919,14 +995,10 @@ def parse_verbose_candidates(output: str) -> List[Dict[str, Any]]:
             logger.debug(f"Found Discogs ID (pure number): {discogs_id} for '{full_title}'")
 
     # ✅ FIX: Pattern 3: Fallback - any "Getting master release" line
-    discogs_master_pattern = re.compile(
-        r'discogs:\s*Getting\s+(?:master|release)\s+release\s+(\d+)',
-        re.IGNORECASE
-    )
 
     # Build a map of Discogs API calls to track which ID belongs to which candidate
     discogs_api_calls = []
-    for match in discogs_master_pattern.finditer(cleaned):
+    for match in _DISCOGS_API_CALL_RE.finditer(cleaned):
         discogs_number = match.group(1)
         discogs_api_calls.append(discogs_number)
         logger.debug(f"Found Discogs API call for ID: {discogs_number}")
@@ -935,16 +1007,10 @@ def parse_verbose_candidates(output: str) -> List[Dict[str, Any]]:
     # PHASE 2: Extract details from user-friendly candidates section
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-    block_pattern = re.compile(
-        r'^\s*(\d+)\.\s*\(([\d.]+)%\)\s*(.+?)\s*\n'
-        r'\s*≠\s*(.+?)\s*\n'
-        r'\s*(MusicBrainz|Discogs),\s*(.+?)(?=\n\s*\d+\.|$)',
-        re.MULTILINE | re.IGNORECASE | re.DOTALL
-    )
 
     discogs_candidate_index = 0  # Track which Discogs candidate we're on
 
-    for match in block_pattern.finditer(cleaned):
+    for match in _CANDIDATE_BLOCK_RE.finditer(cleaned):
         idx = int(match.group(1))
         similarity = float(match.group(2))
         artist_album = match.group(3).strip()
@@ -956,9 +1022,9 @@ def parse_verbose_candidates(output: str) -> List[Dict[str, Any]]:
         parts = [p.strip() for p in metadata.split(',')]
         format_ = parts[0] if len(parts) > 0 and parts[0].lower() != 'none' else None
         year = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
-        country = parts[2] if len(parts) > 2 and parts[2].lower() not in ('none', 'n/a', '') else None
-        label = parts[3] if len(parts) > 3 and parts[3].lower() not in ('none', 'n/a', '') else None
-        catno = parts[4] if len(parts) > 4 and parts[4].lower() not in ('none', 'n/a', '') else None
+        country = _meta_value(parts, 2)
+        label = _meta_value(parts, 3)
+        catno = _meta_value(parts, 4)
 
         # Split artist and album
         artist = artist_album
@@ -966,7 +1032,7 @@ def parse_verbose_candidates(output: str) -> List[Dict[str, Any]]:
         if ' - ' in artist_album:
             artist, album = artist_album.split(' - ', 1)
 
-        differences = [d.strip() for d in differences_line.split(',') if d.strip()]
+        differences = [s for d in differences_line.split(',') if (s := d.strip())]
 
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # PHASE 3: Match with ID map
@@ -1078,21 +1144,41 @@ def parse_verbose_candidates(output: str) -> List[Dict[str, Any]]:
 # HIGH-LEVEL PARSE ENTRYPOINT
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-def parse_beet_output(stdout: str, stderr: str, path: str) -> Dict[str, Any]:
+# Every status marker parse_beet_output looks for, found in one scan.
+# "no (?=candidates)" only consumes "no " so an adjacent "candidates:" is still seen.
+_STATUS_MARKER_RE = re.compile(
+    r'(?P<success>successfully imported|already in library|imported and tagged)'
+    r'|(?P<match>match \()'
+    r'|(?P<mb>musicbrainz\.org)'
+    r'|(?P<discogs>discogs)'
+    r'|(?P<candidates>candidates:)'
+    r'|(?P<no_match>no matching release found|no (?=candidates))'
+    r'|(?P<low_similarity>low similarity)',
+    re.IGNORECASE
+)
+
+
+def parse_beet_output(stdout: str, stderr: str, path: str, pre_cleaned: bool = False) -> Dict[str, Any]:
     """
     High-level parser: classify beet output and build the canonical import dict
     used by the bot. Always returns a dict with the schema defined above.
     Supports both MusicBrainz and Discogs sources.
+    Pass pre_cleaned=True when ANSI codes were already stripped (e.g. while streaming).
     """
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # STEP 1: Clean the output (remove chroma and debug noise)
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     raw = (stdout or "") + "\n" + (stderr or "")
-    cleaned_raw = clean_beet_output(raw)  # 🎯 NEW: Clean before parsing
+    cleaned_raw = clean_beet_output(raw, pre_cleaned=pre_cleaned)  # 🎯 NEW: Clean before parsing
 
-    cleaned_low = cleaned_raw.lower()
+    # Single case-insensitive pass collecting which markers are present
+    found = set()
+    for m in _STATUS_MARKER_RE.finditer(cleaned_raw):
+        found.add(m.lastgroup)
+        if m.lastgroup == 'success':
+            break
 
-    now = datetime.datetime.utcnow().isoformat() + "Z"
+    now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
     base = {
         'status': 'needs_input',
@@ -1106,19 +1192,19 @@ def parse_beet_output(stdout: str, stderr: str, path: str) -> Dict[str, Any]:
     }
 
     # Direct success
-    if any(k in cleaned_low for k in ['successfully imported', 'already in library', 'imported and tagged']):
+    if 'success' in found:
         base['status'] = 'success'
         return base
 
     # Single match (heuristic: presence of "match (" plus musicbrainz/discogs url/id)
-    has_match = 'match (' in cleaned_low
-    has_mb = 'musicbrainz.org' in cleaned_low or extract_musicbrainz_id(cleaned_raw)
-    has_discogs = 'discogs' in cleaned_low and extract_discogs_id(cleaned_raw)
-    has_candidates_section = 'candidates:' not in cleaned_low
+    has_match = 'match' in found
+    has_mb = 'mb' in found or extract_musicbrainz_id(cleaned_raw)
+    has_discogs = 'discogs' in found and extract_discogs_id(cleaned_raw)
+    has_candidates_section = 'candidates' not in found
 
     if has_match and (has_mb or has_discogs) and has_candidates_section:
         base['status'] = 'single_match'
-        info = parse_beet_match_info(cleaned_raw)  # 🎯 Use cleaned output
+        info = parse_beet_match_info(cleaned_raw, pre_cleaned=True)  # 🎯 Use cleaned output
 
         # Put the info into the same schema as a candidate for uniformity
         candidate = {
@@ -1144,9 +1230,9 @@ def parse_beet_output(stdout: str, stderr: str, path: str) -> Dict[str, Any]:
         return base
 
     # Multiple candidates (use verbose parser)
-    if 'candidates:' in cleaned_low:
+    if 'candidates' in found:
         logger.debug('Parsing multiple candidates...')
-        candidates = parse_verbose_candidates(cleaned_raw)  # 🎯 Use cleaned output
+        candidates = parse_verbose_candidates(cleaned_raw, pre_cleaned=True)  # 🎯 Use cleaned output
 
         if candidates:
             base['status'] = 'has_candidates'
@@ -1157,12 +1243,12 @@ def parse_beet_output(stdout: str, stderr: str, path: str) -> Dict[str, Any]:
             return base
 
     # No matches
-    if 'no matching release found' in cleaned_low or 'no candidates' in cleaned_low:
+    if 'no_match' in found:
         base['status'] = 'no_match'
         return base
 
     # Low similarity
-    if 'low similarity' in cleaned_low:
+    if 'low_similarity' in found:
         base['status'] = 'low_similarity'
         return base
 
@@ -1219,6 +1305,20 @@ def clean_chroma_noise(output: str) -> str:
     return '\n'.join(cleaned_lines)
 
 
+# Verbose debug line prefixes filtered out of user-facing output
+_VERBOSE_SKIP_PREFIXES = (
+    'Sending event:',
+    'user configuration:',
+    'data directory:',
+    'plugin paths:',
+    'Loading plugins:',
+    'fetchart:',
+    'library database:',
+    'library directory:',
+    'Disabling art source',
+)
+
+
 def clean_verbose_debug_lines(output: str) -> str:
     """
     Remove verbose debug lines that are not useful for the user.
@@ -1245,24 +1345,11 @@ def clean_verbose_debug_lines(output: str) -> str:
     lines = output.splitlines()
     cleaned_lines = []
 
-    # Patterns to filter out
-    skip_patterns = [
-        'Sending event:',
-        'user configuration:',
-        'data directory:',
-        'plugin paths:',
-        'Loading plugins:',
-        'fetchart:',
-        'library database:',
-        'library directory:',
-        'Disabling art source',
-    ]
-
     for line in lines:
         stripped = line.strip()
 
         # Skip if line matches any skip pattern
-        if any(stripped.startswith(pattern) for pattern in skip_patterns):
+        if stripped.startswith(_VERBOSE_SKIP_PREFIXES):
             continue
 
         cleaned_lines.append(line)
@@ -1270,7 +1357,7 @@ def clean_verbose_debug_lines(output: str) -> str:
     return '\n'.join(cleaned_lines)
 
 
-def clean_beet_output(output: str) -> str:
+def clean_beet_output(output: str, pre_cleaned: bool = False) -> str:
     """
     Master cleaning function: removes all noise from beet output.
 
@@ -1281,29 +1368,42 @@ def clean_beet_output(output: str) -> str:
 
     Args:
         output: Raw beet output
+        pre_cleaned: ANSI codes were already stripped, skip step 1
 
     Returns:
         Clean, user-friendly output
     """
     # Step 1: Remove ANSI codes
-    cleaned = clean_ansi_codes(output)
-
-    # Step 2: Remove chroma noise
-    cleaned = clean_chroma_noise(cleaned)
-
-    # Step 3: Remove verbose debug lines
-    if not BEET_DEBUG_MODE:
-        cleaned = clean_verbose_debug_lines(cleaned)
+    cleaned = output if pre_cleaned else clean_ansi_codes(output)
+    if not cleaned:
+        return ''
 
-    # Step 4: Normalize whitespace (remove excessive blank lines)
-    lines = cleaned.splitlines()
+    # Steps 2-4 in a single pass over the lines (same rules, same order as
+    # clean_chroma_noise -> clean_verbose_debug_lines -> blank collapsing)
+    skip_verbose = not BEET_DEBUG_MODE
     cleaned_lines = []
+    skip_next = False
     prev_blank = False
 
-    for line in lines:
-        is_blank = not line.strip()
+    for line in cleaned.splitlines():
+        stripped = line.strip()
+
+        # Step 2: Remove chroma noise
+        if stripped.startswith('chroma:'):
+            if 'matched recordings' in line or 'on releases' in line:
+                skip_next = True  # Skip potential continuation
+            continue
+        if skip_next:
+            if stripped.startswith(('[', "'")):
+                continue
+            skip_next = False
+
+        # Step 3: Remove verbose debug lines
+        if skip_verbose and stripped.startswith(_VERBOSE_SKIP_PREFIXES):
+            continue
 
-        # Skip consecutive blank lines
+        # Step 4: Normalize whitespace (skip consecutive blank lines)
+        is_blank = not stripped
         if is_blank and prev_blank:
             continue
 
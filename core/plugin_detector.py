@@ -2,11 +2,13 @@
 Plugin detection system for beet
 Detects which plugins are enabled and adapts UI accordingly
 """
+import os
 import subprocess
+import shutil
 import json
 import re
 from pathlib import Path
-from config import BEET_CONTAINER, BEET_USER, setup_logging
+from config import BEET_CONTAINER, BEET_USER, PLUGIN_CACHE_FILE, setup_logging
 
 logger = setup_logging()
 
@@ -105,6 +107,55 @@ class BeetPluginDetector:
         logger.info(f"Detected plugins: {plugins}")
         return plugins
 
+    def _get_install_key(self):
+        """
+        Identify the beet installation so the disk cache can be invalidated.
+        Docker: container id + start time. Local: beet executable path + mtime.
+        """
+        try:
+            if BEET_CONTAINER:
+                result = subprocess.run(
+                    ["docker", "inspect", "-f", "{{.Id}} {{.State.StartedAt}}", BEET_CONTAINER],
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                return result.stdout.strip() if result.returncode == 0 else None
+
+            beet_bin = shutil.which("beet")
+            if beet_bin:
+                return f"{beet_bin}:{os.stat(beet_bin).st_mtime_ns}"
+        except Exception as e:
+            logger.debug(f"Could not compute beet install key: {e}")
+        return None
+
+    def _load_disk_cache(self, key):
+        """Return cached plugins if the cache file matches the install key"""
+        if not key:
+            return None
+        try:
+            with open(PLUGIN_CACHE_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("key") == key:
+                return set(data.get("plugins", []))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to load plugin cache: {e}")
+        return None
+
+    def _save_disk_cache(self, key, plugins):
+        """Atomically write detected plugins to the cache file"""
+        if not key:
+            return
+        tmp = PLUGIN_CACHE_FILE + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "plugins": sorted(plugins)}, f)
+            os.replace(tmp, PLUGIN_CACHE_FILE)
+        except Exception as e:
+            logger.warning(f"Failed to save plugin cache: {e}")
+
     def get_enabled_plugins(self, force_refresh=False):
         """
         Get set of enabled plugins.
@@ -120,9 +171,22 @@ class BeetPluginDetector:
         if not force_refresh and self._cache and (now - self._cache_timestamp) < self.CACHE_TTL:
             return self._cache
 
+        key = self._get_install_key()
+
+        # On first use, reuse plugins detected by a previous run of the bot
+        if not force_refresh and self._cache is None:
+            cached = self._load_disk_cache(key)
+            if cached is not None:
+                logger.info(f"Loaded plugins from cache: {cached}")
+                self._cache = cached
+                self._cache_timestamp = now
+                return cached
+
         # Fetch fresh config
         config_output = self._run_beet_config()
         plugins = self._parse_plugins_from_config(config_output)
+        if config_output is not None:
+            self._save_disk_cache(key, plugins)
 
         # Update cache
         self._cache = plugins
@@ -0,0 +1,69 @@
+"""
+Coalesces rapid text lines into few Telegram messages
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from core.utils import truncate_for_telegram
+
+logger = logging.getLogger(__name__)
+
+
+class TelegramBatcher:
+    """
+    Buffers lines per chat and flushes them every `flush_interval` seconds
+    as a single message (split near Telegram's 4096 char limit).
+    """
+
+    def __init__(self, bot, flush_interval=2.0, max_chars=3900):
+        self.bot = bot
+        self.flush_interval = flush_interval
+        self.max_chars = max_chars
+        self._buffers = defaultdict(list)
+        self._task = None
+
+    def start(self):
+        """Start the background flush loop (needs a running event loop)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush loop and send whatever is still buffered"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush_all()
+
+    def add(self, chat_id, line):
+        """Queue a line for the given chat"""
+        if line:
+            self._buffers[chat_id].append(line)
+
+    async def flush(self, chat_id):
+        """Send buffered lines for a chat right away"""
+        lines = self._buffers.pop(chat_id, None)
+        if not lines:
+            return
+
+        text = "\n".join(
+            line if len(line) <= self.max_chars else line[:self.max_chars]
+            for line in lines
+        )
+        for part in truncate_for_telegram(text, limit=self.max_chars):
+            try:
+                await self.bot.send_message(chat_id=chat_id, text=part)
+            except Exception as e:
+                logger.warning(f"Failed to flush batch to chat {chat_id}: {e}")
+
+    async def flush_all(self):
+        for chat_id in list(self._buffers):
+            await self.flush(chat_id)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush_all()
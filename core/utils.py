@@ -97,12 +97,17 @@ def truncate_for_telegram(text: str, limit: int = 4000) -> list[str]:
 
     parts, current = [], ""
     for line in text.splitlines():
-        if len(current) + len(line) + 1 <= limit:
-            current += line + "\n"
-        else:
-            parts.append(current)
-            current = line + "\n"
-    if current:
+        # Hard-split lines that can't fit in one part on their own
+        pieces = [line[i:i + limit - 1] for i in range(0, len(line), limit - 1)] or [""]
+        for piece in pieces:
+            if len(current) + len(piece) + 1 <= limit:
+                current += piece + "\n"
+            else:
+                # Telegram rejects blank messages, so never emit one
+                if current.strip():
+                    parts.append(current)
+                current = piece + "\n"
+    if current.strip():
         parts.append(current)
     return parts
 
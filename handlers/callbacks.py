@@ -9,7 +9,7 @@ from telegram.ext import ContextTypes
 from telegram.error import BadRequest
 from telegram.helpers import escape_markdown
 from i18n.translations import t
-from config import BEET_CONTAINER, BEET_USER, IMPORT_PATH, DIFF_STYLE, setup_logging
+from config import BEET_CONTAINER, BEET_USER, IMPORT_PATH, DIFF_STYLE, BEET_DEBUG_MODE, setup_logging
 from core.directory_analyzer import analyze_directory, get_search_query
 from core.parsers import clean_ansi_codes, format_difference_with_diff
 from ui.keyboards import (
@@ -37,10 +37,24 @@ def get_selected_dir(manager, idx):
     dirs = manager.get_import_directories()
     return dirs[idx] if idx < len(dirs) else None
 
+def get_progress_callback(context, chat_id):
+    """Returns an on_line callback streaming beet output to the chat (debug mode only)"""
+    batcher = context.bot_data.get('batcher')
+    if not (BEET_DEBUG_MODE and batcher):
+        return None
+    # Lines arrive ANSI-clean from BeetImportManager._read_stream
+    return lambda line: batcher.add(chat_id, line)
+
+async def flush_progress(context, chat_id):
+    batcher = context.bot_data.get('batcher')
+    if batcher:
+        await batcher.flush(chat_id)
+
 
 # --- Core Dispatcher ----------------------------------------------------------
 
-async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE, manager):
+async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    manager = context.bot_data["manager"]
     query = update.callback_query
     await query.answer()
     action = query.data or ""
@@ -266,7 +280,7 @@ async def delete_directory(query, idx, context, manager):
         await query.edit_message_text(t('directory.not_available'))
         return
 
-    result = manager.delete_directory(str(selected))
+    result = await manager.delete_directory(str(selected))
     if result['status'] != 'success':
         key = f"delete.{result['message']}" if result['message'] in ['error_root', 'error_not_found'] else 'delete.error'
         await query.edit_message_text(t(key, error=result.get('message', '')))
@@ -343,8 +357,11 @@ async def start_import(query, idx, context, manager):
     name_escaped = escape_markdown(selected.name, version=2)
     msg_start = await query.message.reply_text(t('import.starting', name=name_escaped), parse_mode='MarkdownV2')
 
+    on_line = get_progress_callback(context, query.message.chat.id)
     try:
-        result = manager.start_import(str(selected))
+        result = await manager.start_import(str(selected), on_line=on_line)
+        if on_line:
+            await flush_progress(context, query.message.chat.id)
         manager.current_import = result
         manager.save_state()
 
@@ -507,13 +524,13 @@ async def confirm_import_with_source(query, source: str, id_value: str, context,
     # Execute import
     try:
         if source == 'mb':
-            result = manager.import_with_id(
+            result = await manager.import_with_id(
                 manager.current_import["path"],
                 id=id_value,
                 auto_apply=True
             )
         else:  # discogs
-            result = manager.import_with_id(
+            result = await manager.import_with_id(
                 manager.current_import["path"],
                 id=id_value,
                 auto_apply=True
@@ -569,7 +586,7 @@ async def import_with_mb_id(query=None, update=None, mb_id=None, context=None, m
     if not auto_apply:
         await message.reply_text(t("import.with_mb_id"), parse_mode='MarkdownV2')
 
-    result = manager.import_with_id(
+    result = await manager.import_with_id(
         manager.current_import["path"],
         id=mb_id,
         auto_apply=auto_apply
@@ -611,7 +628,7 @@ async def import_with_discogs_id(query=None, update=None, discogs_id=None, conte
     if not auto_apply:
         await message.reply_text(t("import.with_discogs_id"), parse_mode='MarkdownV2')
 
-    result = manager.import_with_id(
+    result = await manager.import_with_id(
         manager.current_import["path"],
         id=discogs_id,
         auto_apply=auto_apply
@@ -815,13 +832,13 @@ async def confirm_import_from_context(query, context, manager):
 
     try:
         if source == 'mb':
-            result = manager.import_with_id(
+            result = await manager.import_with_id(
                 manager.current_import["path"],
                 id=id_value,
                 auto_apply=True
             )
         else:  # discogs
-            result = manager.import_with_id(
+            result = await manager.import_with_id(
                 manager.current_import["path"],
                 id=id_value,
                 auto_apply=True
@@ -863,7 +880,7 @@ async def cancel_current_import(query, context, manager):
 
 
 async def skip_import(query, context, manager):
-    result = manager.skip_item(manager.current_import['path'])
+    result = await manager.skip_item(manager.current_import['path'])
     await cleanup_old_status_message(context, query.message.chat.id, 'skipped_label')
     await query.message.reply_text(t('status.skipped', message=result['message']))
     manager.clear_state()
@@ -872,7 +889,10 @@ async def skip_import(query, context, manager):
 async def retry_import(query, context, manager):
     await query.message.reply_text(t('import.retrying'), parse_mode='MarkdownV2')
     await cleanup_old_status_message(context, query.message.chat.id, 'cancelled_label')
-    result = manager.start_import(manager.current_import['path'])
+    on_line = get_progress_callback(context, query.message.chat.id)
+    result = await manager.start_import(manager.current_import['path'], on_line=on_line)
+    if on_line:
+        await flush_progress(context, query.message.chat.id)
     manager.current_import = result
     manager.save_state()
     mid = await format_and_send_import_status(query.message, result, manager, context)
@@ -881,7 +901,7 @@ async def retry_import(query, context, manager):
 
 async def search_more(query, context, manager):
     await query.message.reply_text(t('import.searching'))
-    result = manager.search_candidates(manager.current_import['path'])
+    result = await manager.search_candidates(manager.current_import['path'])
     output = clean_ansi_codes(result.get('output', t('import.no_results')))
     await query.message.reply_text(t('import.search_result', output=output[:1000]), parse_mode='Markdown')
 
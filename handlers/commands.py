@@ -9,7 +9,7 @@ from telegram import Update
 from telegram.helpers import escape_markdown
 from telegram.ext import ContextTypes
 from i18n.translations import t
-from config import IMPORT_PATH, TELEGRAM_CHAT_ID, CUSTOM_COMMANDS, BEET_CONTAINER, BEET_USER, setup_logging
+from config import IMPORT_PATH, TELEGRAM_CHAT_ID, CUSTOM_COMMANDS_BY_NAME, BEET_CONTAINER, BEET_USER, setup_logging
 from ui.keyboards import create_directory_list_keyboard, create_import_status_keyboard
 from ui.messages import format_import_status
 
@@ -37,7 +37,7 @@ def check_allowed_user(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bo
         logger.error(f"Error checking user: {e}")
         return False
 
-async def start(update: Update, context: ContextTypes.DEFAULT_TYPE, manager):
+async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handler for /start"""
     if not check_allowed_user(update, context):
         await update.message.reply_text(t('status.access_denied'))
@@ -49,8 +49,9 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE, manager):
     )
 
 
-async def list_imports(update: Update, context: ContextTypes.DEFAULT_TYPE, manager):
+async def list_imports(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Shows the list of directories to import"""
+    manager = context.bot_data["manager"]
     logger.info("list_imports called")
 
     if not check_allowed_user(update, context):
@@ -110,8 +111,9 @@ async def list_imports(update: Update, context: ContextTypes.DEFAULT_TYPE, manag
     logger.debug(f"New list message created: {sent.message_id}")
 
 
-async def list_imports2(update: Update, context: ContextTypes.DEFAULT_TYPE, manager):
+async def list_imports2(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Shows the list of directories to import"""
+    manager = context.bot_data["manager"]
     logger.info(f"list_imports called")
     if not check_allowed_user(update, context):
         await update.message.reply_text(t('status.access_denied'))
@@ -157,8 +159,9 @@ async def list_imports2(update: Update, context: ContextTypes.DEFAULT_TYPE, mana
     context.user_data['list_message_id'] = msg.message_id
 
 
-async def status(update: Update, context: ContextTypes.DEFAULT_TYPE, manager):
+async def status(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Shows current import status"""
+    manager = context.bot_data["manager"]
     if not check_allowed_user(update, context):
         await update.message.reply_text(t('status.access_denied'))
         return
@@ -170,8 +173,9 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE, manager):
         await update.message.reply_text(t('commands.no_import')) # Message when no import is active
 
 
-async def cancel_import(update: Update, context: ContextTypes.DEFAULT_TYPE, manager):
+async def cancel_import(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Cancels the current import"""
+    manager = context.bot_data["manager"]
     if not check_allowed_user(update, context):
         await update.message.reply_text(t('status.access_denied'))
         return
@@ -258,11 +262,8 @@ async def execute_custom_command(update: Update, context: ContextTypes.DEFAULT_T
     command_name = update.message.text.split()[0].replace('/', '')
 
     # --- 1. SEARCH COMMAND AND PREPARE beet_command_str ---
-    beet_command_str = None
-    for item in CUSTOM_COMMANDS:
-        if item['cmd'] == command_name:
-            beet_command_str = item['action']
-            break
+    item = CUSTOM_COMMANDS_BY_NAME.get(command_name)
+    beet_command_str = item['action'] if item else None
 
     if not beet_command_str:
         # Nessun parse_mode, nessun escape necessario
@@ -302,12 +303,15 @@ async def execute_custom_command(update: Update, context: ContextTypes.DEFAULT_T
     )
     timeout = 300
     try:
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             action,
             capture_output=True,
             text=True,
             timeout=timeout
         )
+        # Custom commands may change the beets library: drop memoized searches
+        context.bot_data["manager"].clear_search_cache()
 
         # Initialize final output with success status
         output = t('commands.executed_header', display_action=display_action_escaped) # Message for command executed (header)
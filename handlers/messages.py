@@ -1,6 +1,7 @@
 """
 Handler for text messages (ID input, confirmations)
 """
+import asyncio
 import subprocess
 from telegram import Update
 from telegram.ext import ContextTypes
@@ -9,8 +10,9 @@ from config import BEET_CONTAINER, BEET_USER
 from handlers.commands import cleanup_old_status_message
 from handlers.callbacks import import_with_mb_id, import_with_discogs_id
 
-async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE, manager):
+async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handler for messages (entered IDs)"""
+    manager = context.bot_data["manager"]
     if 'waiting_for' not in context.user_data or not manager.current_import:
         return
 
@@ -51,39 +53,41 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE, man
         if text.upper() in ['SI', 'YES', 'Y', 'OK', 'SÌ']:
             await update.message.reply_text(t('import.as_is'), parse_mode='MarkdownV2')
 
-            try:
-                beet_path = manager.translate_path_for_beet(manager.current_import['path'])
-                beet_cmd = ['beet', 'import', beet_path]
+            async with manager.import_lock:
+                try:
+                    beet_path = manager.translate_path_for_beet(manager.current_import['path'])
+                    beet_cmd = ['beet', 'import', beet_path]
 
-                if BEET_CONTAINER:
-                    cmd = ['docker', 'exec', '-i']
-                    if BEET_USER:
-                        cmd.extend(['-u', BEET_USER])
-                    cmd.extend([BEET_CONTAINER] + beet_cmd)
-                else:
-                    cmd = beet_cmd
+                    if BEET_CONTAINER:
+                        cmd = ['docker', 'exec', '-i']
+                        if BEET_USER:
+                            cmd.extend(['-u', BEET_USER])
+                        cmd.extend([BEET_CONTAINER] + beet_cmd)
+                    else:
+                        cmd = beet_cmd
 
-                result = subprocess.run(
-                    cmd,
-                    input='U\n',
-                    capture_output=True,
-                    text=True,
-                    timeout=300
-                )
+                    result = await asyncio.to_thread(
+                        subprocess.run,
+                        cmd,
+                        input='U\n',
+                        capture_output=True,
+                        text=True,
+                        timeout=300
+                    )
 
-                if result.returncode == 0:
-                    # Cleanup old message before confirming
-                    await cleanup_old_status_message(context, update.message.chat_id, 'completed_label')
-                    await update.message.reply_text(t('status.import_completed'), parse_mode='MarkdownV2')
-                    manager.clear_state()
-                else:
-                    error_output = result.stderr[:200] if result.stderr else "Unknown error"
-                    await update.message.reply_text(f"❌ {error_output}")
+                    if result.returncode == 0:
+                        # Cleanup old message before confirming
+                        await cleanup_old_status_message(context, update.message.chat_id, 'completed_label')
+                        await update.message.reply_text(t('status.import_completed'), parse_mode='MarkdownV2')
+                        manager.clear_state()
+                    else:
+                        error_output = result.stderr[:200] if result.stderr else "Unknown error"
+                        await update.message.reply_text(f"❌ {error_output}")
 
-            except subprocess.TimeoutExpired:
-                await update.message.reply_text("⏱️ Import timed out (>5 minutes)")
-            except Exception as e:
-                await update.message.reply_text(f"❌ {str(e)}")
+                except subprocess.TimeoutExpired:
+                    await update.message.reply_text("⏱️ Import timed out (>5 minutes)")
+                except Exception as e:
+                    await update.message.reply_text(f"❌ {str(e)}")
         else:
             await update.message.reply_text(t('prompts.cancelled'))
 
@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+
+# Import root and beets config must be set before config.py / beets are imported
+_TMP = tempfile.mkdtemp(prefix="beet-telegram-bot-tests-")
+os.environ.setdefault("IMPORT_PATH", os.path.join(_TMP, "downloads"))
+os.environ.setdefault("BEETSDIR", os.path.join(_TMP, "beets"))
+os.makedirs(os.environ["IMPORT_PATH"], exist_ok=True)
+os.makedirs(os.environ["BEETSDIR"], exist_ok=True)
+os.environ.pop("BEET_CONTAINER", None)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
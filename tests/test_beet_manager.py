@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+from core.beet_manager import BeetImportManager
+
+
+def test_ls_albums_native_matches_whole_path(tmp_path):
+    beets_config = pytest.importorskip("beets").config
+    from beets import library
+
+    beets_config["library"] = str(tmp_path / "library.db")
+    beets_config["directory"] = str(tmp_path / "music")
+    beets_config["plugins"] = []
+
+    lib = library.Library(str(tmp_path / "library.db"), str(tmp_path / "music"))
+    wanted = tmp_path / "Artist - Album (2020) O'Brien"
+    other = tmp_path / "Other"
+    wanted.mkdir()
+    other.mkdir()
+    lib.add_album([library.Item(
+        title="t1", albumartist="Artist", album="Album",
+        path=os.fsencode(wanted / "01.flac"),
+    )])
+    # Matches the shlex-split terms ("Artist", "Album", ...) but not the path
+    lib.add_album([library.Item(
+        title="t2", albumartist="Artist", album="Album (2020)",
+        path=os.fsencode(other / "01.flac"),
+    )])
+    lib._close()
+
+    manager = BeetImportManager()
+    result = manager._ls_albums_native(f"path:{wanted}")
+
+    assert result is not None
+    assert result.returncode == 0
+    assert result.stdout.splitlines() == ["Artist - Album"]
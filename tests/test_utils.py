@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip("telegram")
+
+from core.utils import truncate_for_telegram
+
+
+def test_truncate_first_line_at_limit_has_no_empty_part():
+    parts = truncate_for_telegram("x" * 10 + "\nabc", limit=10)
+    assert all(part.strip() for part in parts)
+    assert all(len(part) <= 10 for part in parts)
+    assert "".join(parts).replace("\n", "") == "x" * 10 + "abc"
+
+
+def test_truncate_splits_overlong_line():
+    parts = truncate_for_telegram("y" * 25, limit=10)
+    assert all(0 < len(part) <= 10 for part in parts)
+    assert "".join(parts).replace("\n", "") == "y" * 25